@@ -1,42 +1,2694 @@
-﻿import logging
+﻿import argparse
+import json
+import logging
+import multiprocessing
 import os
+import random
 import shutil
+import sqlite3
 import sys
 import threading
 import time
-import tkinter as tk
 import webbrowser
 import ctypes
+import collections
+import concurrent.futures
+import contextlib
+import hashlib
+import ctypes.util
+import importlib
 import re
 from ctypes import wintypes
 from pathlib import Path
-from tkinter import messagebox
-from tkinter.scrolledtext import ScrolledText
 
-import pyautogui
-import pystray
-import pytesseract
-import requests
-from deep_translator import GoogleTranslator
-from PIL import Image, ImageDraw, ImageGrab, ImageOps, ImageTk
+# numpy, PIL, pytesseract, requests und deep_translator werden erst bei Bedarf (oder vom
+# Warm-up-Thread) importiert, damit Tray und Hotkeys nach dem Login schnell bereit sind.
+# tkinter nur in TranslationApp, damit --batch auch ohne Tk (Server, Slim-Images) laeuft.
+STARTUP_STARTED = time.perf_counter()
+# Parallel wird ueber eigene Threads/Prozesse pro Handle; OpenMP-Teams je Handle und je
+# pytesseract-Prozess wuerden die Kerne nur ueberbuchen. Muss vor dem Laden von
+# libtesseract gesetzt sein und wird an Batch-Worker und Unterprozesse vererbt.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
 
 TESSERACT_URL = "https://github.com/UB-Mannheim/tesseract/wiki"
 PROJECT_URL = "https://github.com/devdbzemusic/Transilvania"
+TESSDATA_URL = "https://raw.githubusercontent.com/tesseract-ocr/tessdata_fast/main/{name}"
+TESSDATA_API_URL = (
+    "https://api.github.com/repos/tesseract-ocr/tessdata_fast/contents/{name}?ref=main"
+)
+TESSDATA_DOWNLOAD_WORKERS = 4
+TESSDATA_DOWNLOAD_ATTEMPTS = 3
+
+logging.basicConfig(
+    filename="transilvania.log",
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+
+OEM_LSTM_ONLY = 1
+OEM_DEFAULT = 3
+OSD_LANGUAGE = "osd"
+# Schrift (Tesseract-OSD) -> passende Sprachmodelle.
+OCR_SCRIPT_LANGUAGES = {
+    "Latin": ("eng",),
+    "Cyrillic": ("rus", "ukr"),
+    "Arabic": ("ara",),
+}
+OCR_SCRIPT_MIN_CONFIDENCE = 1.0
+OCR_SCALE = 2
+# Zeilenhoehe (Pixel), auf die Text vor der Erkennung skaliert wird; LSTM-Modelle
+# arbeiten bei etwa 30 px Zeilenhoehe am besten.
+OCR_TARGET_LINE_HEIGHT = 32
+OCR_MIN_SCALE = 0.5
+OCR_MAX_SCALE = 4.0
+OCR_BINARIZE_OFFSET = 10
+OCR_CONFIGS = (
+    "--oem 1 --psm 6",
+    "--oem 1 --psm 11",
+    "--oem 1 --psm 3",
+)
+# Suchraum des Auto-Tuners (--autotune) auf eigenen Aufnahmen; PSM 4/7 fuer Spalten bzw.
+# Einzelzeilen. Das Ergebnis landet als Profil in ocr_profile.json.
+AUTOTUNE_CONFIGS = OCR_CONFIGS + ("--oem 1 --psm 4", "--oem 1 --psm 7")
+AUTOTUNE_SCALES = (None, 1, 2, 3)
+AUTOTUNE_MIN_ACCURACY = 0.95
+OCR_PROFILE_NAME = "ocr_profile.json"
+
+OCR_TSV_WORD_LEVEL = 5
+
+# Textpruefung vor der Uebersetzung: haeufigste Funktionswoerter pro Sprache (ISO 639-1)
+# fuer eine schnelle Trefferquote ohne externe Woerterbuecher.
+OCR_LANGUAGE_ISO = {"eng": "en", "deu": "de", "rus": "ru", "ukr": "uk", "ara": "ar"}
+TEXT_STOPWORDS = {
+    "en": frozenset(
+        "the of and to a in is it you that he was for on are with as i his they be at one "
+        "have this from or had by not but what all were we when your can said there use an "
+        "each which she do how their if will up other about out many then them these so".split()
+    ),
+    "de": frozenset(
+        "der die das und ist in zu den nicht von sie mit es des sich auf dem ein eine auch "
+        "als an er so dass wie bei oder wir aus ich noch nach ihr werden hat einen um sind "
+        "wird kann nur wenn aber war vor zur bis mehr durch man ueber über im am für fuer".split()
+    ),
+    "ru": frozenset(
+        "и в не на я что он с как а то это по но из у к за все она так его же от было "
+        "вы для мы бы о ты только уже или ещё еще да нет был есть когда их если при".split()
+    ),
+    "uk": frozenset(
+        "і й в у не на що я з як а це та до за його від він вона ми ви але так ж бо "
+        "був є коли їх якщо при для або вже ще щоб які яка який".split()
+    ),
+    "ar": frozenset(
+        "في من على إلى أن عن مع هذا هذه التي الذي كان ما لا هو هي قد كل ثم أو بين "
+        "عند بعد قبل إذا لم لن ان الى".split()
+    ),
+}
+TEXT_MIN_LETTER_RATIO = 0.5
+TEXT_TARGET_MIN_HITS = 0.2
+
+WARMUP_MODULES = (
+    "numpy",
+    "PIL.Image",
+    "PIL.ImageOps",
+    "PIL.ImageFilter",
+    "PIL.ImageGrab",
+    "pytesseract",
+    "requests",
+    "deep_translator",
+    "pyautogui",
+)
+BACKGROUND_SIZE = (436, 320)
+READINESS_LABELS = {
+    "cold": "kalt",
+    "warming": "waermt auf...",
+    "ready": "bereit",
+    "failed": "Fehler beim Aufwaermen",
+}
+# Overlay-Zustand -> (Textfarbe, Schrift)
+OVERLAY_STYLES = {
+    "progress": ("#9a9a9a", ("Segoe UI", 10, "italic")),
+    "source": ("#c8c8c8", ("Segoe UI", 11)),
+    "final": ("white", ("Segoe UI", 11, "bold")),
+}
+OVERLAY_SOURCE_PREVIEW_CHARS = 600
+# Das Overlay liegt ueber dem Mausbereich und darf nicht in die OCR-Aufnahme geraten.
+WDA_EXCLUDEFROMCAPTURE = 0x11
+
+# Uebersetzungs-Richtlinie -> Reihenfolge der Uebersetzer. Liefert einer nichts (nicht
+# verfuegbar, Fehler, Woerterbuch deckt zu wenig ab), kommt der naechste dran.
+TRANSLATION_POLICIES = {
+    "online": ("google",),
+    "offline": ("dictionary",),
+    "offline_first": ("dictionary", "google"),
+    "online_first": ("google", "dictionary"),
+    "fake": ("fake",),
+}
+TRANSLATION_POLICY_LABELS = {
+    "online": "Online (Google)",
+    "offline": "Nur offline (Woerterbuch)",
+    "offline_first": "Offline zuerst, online als Fallback",
+    "online_first": "Online zuerst, offline als Fallback",
+    "fake": "Test (ohne Uebersetzung)",
+}
+
+
+def _elapsed_ms(start):
+    return round((time.perf_counter() - start) * 1000.0, 2)
+
+
+class CancelToken:
+    # Abbruchsignal fuer laufende OCR-Jobs. Ein Kind-Token gilt auch als gesetzt, wenn
+    # ein Eltern-Token gesetzt wurde (z.B. Region abgebrochen -> alle ihre PSM-Laeufe).
+    def __init__(self, parent=None):
+        self.event = threading.Event()
+        self.parent = parent
+
+    def set(self):
+        self.event.set()
+
+    def is_set(self):
+        return self.event.is_set() or (self.parent is not None and self.parent.is_set())
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class JobScheduler:
+    # Hotkey-Auftraege ueber einen begrenzten Pool. Es wartet hoechstens ein Auftrag; ein
+    # neuer ersetzt ihn und setzt das CancelToken aller laufenden Auftraege, die dann
+    # kooperativ abbrechen. Jeder Auftrag hat eine fortlaufende ID, damit nur das Ergebnis
+    # des neuesten angezeigt wird.
+    def __init__(self, max_workers=2):
+        self.max_workers = max_workers
+        self.lock = threading.Lock()
+        self.latest_id = 0
+        self.pending = None
+        self.running = {}
+        self.pool = None
+
+    def submit(self, fn, *args):
+        # fn(job_id, cancel_event, *args) laeuft in einem Worker-Thread.
+        with self.lock:
+            self.latest_id += 1
+            job_id = self.latest_id
+            for token in self.running.values():
+                token.set()
+            if self.pending is not None:
+                logging.info("Auftrag %s verworfen, ersetzt durch %s.", self.pending[0], job_id)
+            self.pending = (job_id, CancelToken(), fn, args)
+        self._dispatch()
+        return job_id
+
+    def _dispatch(self):
+        with self.lock:
+            if self.pending is None or len(self.running) >= self.max_workers:
+                return
+            job_id, token, fn, args = self.pending
+            self.pending = None
+            self.running[job_id] = token
+            if self.pool is None:
+                self.pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="hotkey-job",
+                )
+            self.pool.submit(self._run, job_id, token, fn, args)
+
+    def _run(self, job_id, token, fn, args):
+        try:
+            fn(job_id, token, *args)
+        except Exception:
+            logging.exception("Auftrag %s fehlgeschlagen.", job_id)
+        finally:
+            with self.lock:
+                self.running.pop(job_id, None)
+            self._dispatch()
+
+    def is_current(self, job_id):
+        with self.lock:
+            return job_id == self.latest_id
+
+    def shutdown(self):
+        with self.lock:
+            self.pending = None
+            for token in self.running.values():
+                token.set()
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+class LatencyTracer:
+    # Zeitmessung pro Hotkey-Druck: jeder Druck ist ein Trace, jede Stufe ein Span mit
+    # Dauer und Attributen (Bildgroesse, Textlaenge, Cache-Treffer). Pro Stufe werden die
+    # letzten Dauern fuer p50/p95/p99 im Speicher gehalten.
+    def __init__(self, max_traces=200, max_samples=1000):
+        self.traces = collections.deque(maxlen=max_traces)
+        self.samples = collections.defaultdict(lambda: collections.deque(maxlen=max_samples))
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    @contextlib.contextmanager
+    def trace(self, name, stage="total", **attrs):
+        # stage: Name der Gesamtdauer in den Perzentilen; Beobachtungszyklen zaehlen
+        # getrennt von Hotkey-Druecken.
+        record = {
+            "name": name,
+            "started": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "attrs": dict(attrs),
+            "spans": [],
+        }
+        previous = (getattr(self.local, "trace", None), getattr(self.local, "spans", None))
+        self.local.trace = record
+        self.local.spans = []
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["total_ms"] = _elapsed_ms(start)
+            self.local.trace, self.local.spans = previous
+            with self.lock:
+                self.traces.append(record)
+                self.samples[stage].append(record["total_ms"])
+                for span in record["spans"]:
+                    self.samples[span["stage"]].append(span["ms"])
+            logging.info(
+                "Trace %s: %s | gesamt=%sms",
+                name,
+                ", ".join(f"{span['stage']}={span['ms']}ms" for span in record["spans"]),
+                record["total_ms"],
+            )
+
+    @contextlib.contextmanager
+    def span(self, stage, **attrs):
+        record = getattr(self.local, "trace", None)
+        spans = getattr(self.local, "spans", None)
+        span = {"stage": stage}
+        span.update(attrs)
+        if spans is not None:
+            spans.append(span)
+        start = time.perf_counter()
+        try:
+            yield span
+        finally:
+            span["ms"] = _elapsed_ms(start)
+            if spans:
+                spans.pop()
+            if record is not None:
+                record["spans"].append(span)
+
+    def current(self):
+        return getattr(self.local, "trace", None)
+
+    @contextlib.contextmanager
+    def attach(self, record):
+        # Haengt einen Worker-Thread an den Trace des ausloesenden Threads an.
+        previous = (getattr(self.local, "trace", None), getattr(self.local, "spans", None))
+        self.local.trace = record
+        self.local.spans = []
+        try:
+            yield record
+        finally:
+            self.local.trace, self.local.spans = previous
+
+    def annotate(self, **attrs):
+        spans = getattr(self.local, "spans", None)
+        if spans:
+            spans[-1].update(attrs)
+        else:
+            record = getattr(self.local, "trace", None)
+            if record is not None:
+                record["attrs"].update(attrs)
+
+    def stage_stats(self):
+        with self.lock:
+            snapshot = {stage: list(values) for stage, values in self.samples.items()}
+        return {
+            stage: {
+                "count": len(values),
+                "p50_ms": round(percentile(values, 50), 1),
+                "p95_ms": round(percentile(values, 95), 1),
+                "p99_ms": round(percentile(values, 99), 1),
+            }
+            for stage, values in snapshot.items()
+            if values
+        }
+
+    def dump(self, path):
+        with self.lock:
+            traces = list(self.traces)
+        payload = {"stages": self.stage_stats(), "traces": traces}
+        Path(path).write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+        return path
+
+OcrWord = collections.namedtuple("OcrWord", ("text", "conf", "box", "line_key"))
+
+
+class OcrResult:
+    # Strukturiertes OCR-Ergebnis (Woerter mit Konfidenz und Box) fuer eine Konfiguration.
+    def __init__(self, words=None, config=""):
+        self.words = list(words or [])
+        self.config = config
+
+    @classmethod
+    def from_tsv(cls, tsv, config=""):
+        words = []
+        for row in (tsv or "").splitlines():
+            cols = row.split("\t")
+            if len(cols) < 12 or cols[0] == "level":
+                continue
+            try:
+                level = int(cols[0])
+                conf = float(cols[10])
+            except ValueError:
+                continue
+            text = cols[11].strip()
+            if level != OCR_TSV_WORD_LEVEL or not text or conf < 0:
+                continue
+            left, top, width, height = (int(v) for v in cols[6:10])
+            line_key = (int(cols[1]), int(cols[2]), int(cols[3]), int(cols[4]))
+            words.append(OcrWord(text, conf, (left, top, width, height), line_key))
+        return cls(words, config)
+
+    @property
+    def lines(self):
+        lines = []
+        current_key = None
+        for word in self.words:
+            if word.line_key != current_key:
+                lines.append([])
+                current_key = word.line_key
+            lines[-1].append(word.text)
+        return [" ".join(parts) for parts in lines]
+
+    @property
+    def text(self):
+        return re.sub(r"\s+", " ", " ".join(self.lines)).strip()
+
+    @property
+    def char_count(self):
+        return sum(len(word.text) for word in self.words)
+
+    @property
+    def confidence(self):
+        # Mittlere Wort-Konfidenz, gewichtet mit der Zeichenanzahl (0..100).
+        chars = self.char_count
+        if not chars:
+            return 0.0
+        return sum(word.conf * len(word.text) for word in self.words) / chars
+
+    @classmethod
+    def merge(cls, parts, config=""):
+        # parts: Liste von (OcrResult, (dx, dy)) in Lesereihenfolge. Boxen werden in
+        # Koordinaten des Gesamtbilds verschoben, Zeilen bleiben pro Teil getrennt.
+        words = []
+        for index, (result, (dx, dy)) in enumerate(parts):
+            for word in result.words:
+                left, top, width, height = word.box
+                words.append(
+                    OcrWord(
+                        word.text,
+                        word.conf,
+                        (left + dx, top + dy, width, height),
+                        (index,) + tuple(word.line_key),
+                    )
+                )
+            config = config or result.config
+        return cls(words, config)
+
+    def rescaled(self, factor):
+        # Boxen aus dem vorverarbeiteten (skalierten) Bild zurueck in Aufnahme-Koordinaten.
+        if factor == 1:
+            return self
+        words = [
+            word._replace(box=tuple(int(round(v * factor)) for v in word.box))
+            for word in self.words
+        ]
+        return OcrResult(words, self.config)
+
+    def better_than(self, other):
+        if other is None:
+            return True
+        return (self.confidence, self.char_count) > (other.confidence, other.char_count)
+
+
+def _mask_runs(mask):
+    import numpy as np
+
+    padded = np.concatenate(([0], mask.astype(np.int8), [0]))
+    diff = np.diff(padded)
+    return list(zip(np.flatnonzero(diff == 1).tolist(), np.flatnonzero(diff == -1).tolist()))
+
+
+def detect_text_blocks(
+    image,
+    cell=8,
+    edge_threshold=32,
+    min_density=0.06,
+    max_density=0.7,
+    gap_cells=3,
+    line_gap_cells=2,
+    pad=6,
+):
+    # Schnelle Textblock-Erkennung: Kantendichte pro Zelle (cell x cell Pixel), Zellen
+    # horizontal ueber Wortabstaende und vertikal ueber Zeilenabstaende schliessen, damit
+    # ein Absatz ein Block wird, dann ein XY-Cut (Zeilenbaender -> Spaltenbloecke).
+    # Rueckgabe: Liste von (left, top, right, bottom) in Lesereihenfolge, ohne Ueberlappung.
+    import numpy as np
+
+    gray = gray_array(image).astype(np.int16)
+    height, width = gray.shape
+    rows, cols = height // cell, width // cell
+    if rows == 0 or cols == 0:
+        return [(0, 0, width, height)]
+
+    gray = gray[: rows * cell, : cols * cell]
+    # Glyphen haben Kanten in beiden Richtungen, Rahmen und Trennlinien nur in einer.
+    edges_x = np.zeros(gray.shape, dtype=bool)
+    edges_y = np.zeros(gray.shape, dtype=bool)
+    edges_x[:, 1:] = np.abs(np.diff(gray, axis=1)) > edge_threshold
+    edges_y[1:, :] = np.abs(np.diff(gray, axis=0)) > edge_threshold
+    density_x = edges_x.reshape(rows, cell, cols, cell).mean(axis=(1, 3))
+    density_y = edges_y.reshape(rows, cell, cols, cell).mean(axis=(1, 3))
+    density = density_x + density_y
+    cells = (
+        (density_x >= min_density / 2)
+        & (density_y >= min_density / 2)
+        & (density >= min_density)
+        & (density <= max_density)
+    )
+
+    closed = cells.copy()
+    for shift in range(1, gap_cells + 1):
+        closed[:, shift:] |= cells[:, :-shift]
+        closed[:, :-shift] |= cells[:, shift:]
+    # Nur Luecken bis line_gap_cells fuellen (Zelle mit Text darueber und darunter).
+    above = np.zeros_like(closed)
+    below = np.zeros_like(closed)
+    for shift in range(1, line_gap_cells + 1):
+        above[shift:] |= closed[:-shift]
+        below[:-shift] |= closed[shift:]
+    closed |= above & below
+
+    boxes = []
+    for top, bottom in _mask_runs(closed.any(axis=1)):
+        band = closed[top:bottom]
+        for left, right in _mask_runs(band.any(axis=0)):
+            sub = cells[top:bottom, left:right]
+            if sub.sum() < 2:
+                continue
+            used_rows = np.flatnonzero(sub.any(axis=1))
+            used_cols = np.flatnonzero(sub.any(axis=0))
+            boxes.append(
+                (
+                    int(left + used_cols[0]) * cell,
+                    int(top + used_rows[0]) * cell,
+                    int(left + used_cols[-1] + 1) * cell,
+                    int(top + used_rows[-1] + 1) * cell,
+                )
+            )
+
+    # Rand hoechstens bis zur Mitte des Abstands zum Nachbarblock, damit kein Ausschnitt
+    # Glyphenreste des Nachbarn enthaelt.
+    blocks = []
+    for box in boxes:
+        left, top, right, bottom = box
+        padded = [max(0, left - pad), max(0, top - pad), min(width, right + pad)]
+        padded.append(min(height, bottom + pad))
+        for o_left, o_top, o_right, o_bottom in boxes:
+            if (o_left, o_top, o_right, o_bottom) == box:
+                continue
+            if o_bottom <= top and o_right > padded[0] and o_left < padded[2]:
+                padded[1] = max(padded[1], (o_bottom + top + 1) // 2)
+            elif o_top >= bottom and o_right > padded[0] and o_left < padded[2]:
+                padded[3] = min(padded[3], (bottom + o_top) // 2)
+            elif o_right <= left and o_bottom > padded[1] and o_top < padded[3]:
+                padded[0] = max(padded[0], (o_right + left + 1) // 2)
+            elif o_left >= right and o_bottom > padded[1] and o_top < padded[3]:
+                padded[2] = min(padded[2], (right + o_left) // 2)
+        blocks.append(tuple(padded))
+    return blocks
+
+
+def _text_ink(gray):
+    # "Tinte" (Pixel deutlich abseits vom Hintergrund) auf jeder zweiten Spalte. Spalten mit
+    # Tinte in den meisten Zeilen (Fensterrahmen, Tabellengitter, Scrollbalken) und fast
+    # durchgehend gefuellte Zeilen (Trennlinien, Balken) sind keine Schrift und wuerden
+    # sonst alle Zeilen zu einer einzigen verbinden. Rueckgabe: (Maske, Hintergrundwert).
+    import numpy as np
+
+    background = int(np.median(gray[::4, ::4]))
+    ink = np.abs(gray[:, ::2].astype(np.int16) - background) > 48
+    ink[:, np.count_nonzero(ink, axis=0) > 0.5 * ink.shape[0]] = False
+    ink[np.count_nonzero(ink, axis=1) > 0.9 * ink.shape[1], :] = False
+    return ink, background
+
+
+def estimate_text_height(gray):
+    # Median der Hoehe von Zeilen mit Schrift, siehe _text_ink.
+    # gray: 2D-uint8-Array. Rueckgabe: (Zeilenhoehe oder None, Hintergrundwert).
+    import numpy as np
+
+    ink, background = _text_ink(gray)
+    ink_per_row = np.count_nonzero(ink, axis=1)
+    runs = [(top, bottom) for top, bottom in _mask_runs(ink_per_row >= 2) if bottom - top >= 3]
+    if not runs:
+        return None, background
+    # Nach Tintenmenge gewichteter Median, damit Rauschen und Satzzeichen nicht zaehlen.
+    heights = np.array([bottom - top for top, bottom in runs], dtype=np.float32)
+    weights = np.array([ink_per_row[top:bottom].sum() for top, bottom in runs], dtype=np.float64)
+    order = np.argsort(heights)
+    cumulative = np.cumsum(weights[order])
+    median_index = int(np.searchsorted(cumulative, cumulative[-1] / 2.0))
+    return float(heights[order][median_index]), background
+
+
+def split_into_bands(gray, parts, min_height=64):
+    # Teilt ein Bild in bis zu parts horizontale Baender. Geschnitten wird nur in der Mitte
+    # leerer Zeilen (keine Tinte), jeweils moeglichst nahe an gleich hohen Baendern, damit
+    # keine Textzeile zerteilt wird. Rueckgabe: Liste von (oben, unten).
+    import numpy as np
+
+    height = gray.shape[0]
+    if parts < 2 or height < 2 * min_height:
+        return [(0, height)]
+    ink, _background = _text_ink(gray)
+    blank = np.count_nonzero(ink, axis=1) < 2
+    gaps = [(top + bottom) // 2 for top, bottom in _mask_runs(blank) if 0 < top and bottom < height]
+
+    cuts = []
+    previous = 0
+    for index in range(1, parts):
+        ideal = height * index / parts
+        candidates = [
+            gap for gap in gaps if gap - previous >= min_height and height - gap >= min_height
+        ]
+        if not candidates:
+            break
+        best = min(candidates, key=lambda gap: abs(gap - ideal))
+        cuts.append(best)
+        previous = best
+    bounds = [0] + cuts + [height]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def is_rtl_text(text):
+    # Ueberwiegend arabische/hebraeische Buchstaben -> Lesereihenfolge rechts nach links.
+    letters = [ch for ch in text if ch.isalpha()]
+    if not letters:
+        return False
+    rtl = sum(1 for ch in letters if "\u0590" <= ch <= "\u08ff" or "\ufb1d" <= ch <= "\ufefc")
+    return rtl * 2 > len(letters)
+
+
+def order_for_reading(parts):
+    # parts: Liste von (OcrResult, (left, top, right, bottom)) von oben nach unten. Bloecke,
+    # die sich vertikal ueberlappen, bilden eine Zeile; deren Reihenfolge richtet sich nach
+    # der Schreibrichtung des Textes (Arabisch: rechter Block zuerst).
+    rows = []
+    for part in sorted(parts, key=lambda item: (item[1][1], item[1][0])):
+        box = part[1]
+        if rows and box[1] < rows[-1]["bottom"]:
+            rows[-1]["parts"].append(part)
+            rows[-1]["bottom"] = max(rows[-1]["bottom"], box[3])
+        else:
+            rows.append({"parts": [part], "bottom": box[3]})
+    ordered = []
+    for row in rows:
+        rtl = is_rtl_text(" ".join(result.text for result, _box in row["parts"]))
+        ordered.extend(sorted(row["parts"], key=lambda item: -item[1][2] if rtl else item[1][0]))
+    return ordered
+
+
+class GrayFrame:
+    # Graustufen-Aufnahme als 2D-uint8-Array, ohne Umweg ueber PIL. Bietet die Teile der
+    # PIL-Schnittstelle, die die OCR-Pipeline nutzt; crop liefert eine Sicht ohne Kopie.
+    mode = "L"
+
+    def __init__(self, pixels):
+        self.pixels = pixels
+
+    @property
+    def width(self):
+        return self.pixels.shape[1]
+
+    @property
+    def height(self):
+        return self.pixels.shape[0]
+
+    @property
+    def size(self):
+        return self.width, self.height
+
+    def crop(self, box):
+        left, top, right, bottom = (int(v) for v in box)
+        return GrayFrame(self.pixels[max(0, top) : bottom, max(0, left) : right])
+
+    def tobytes(self):
+        return self.pixels.tobytes()
+
+
+def gray_array(image):
+    # 2D-uint8-Array aus GrayFrame (ohne Kopie) oder PIL-Bild.
+    import numpy as np
+    from PIL import ImageOps
+
+    if isinstance(image, GrayFrame):
+        return image.pixels
+    return np.asarray(ImageOps.grayscale(image))
+
+
+class _RECT(ctypes.Structure):
+    _fields_ = [
+        ("left", ctypes.c_long),
+        ("top", ctypes.c_long),
+        ("right", ctypes.c_long),
+        ("bottom", ctypes.c_long),
+    ]
+
+
+class _MONITORINFO(ctypes.Structure):
+    _fields_ = [
+        ("cbSize", ctypes.c_ulong),
+        ("rcMonitor", _RECT),
+        ("rcWork", _RECT),
+        ("dwFlags", ctypes.c_ulong),
+    ]
+
+
+class _BITMAPINFOHEADER(ctypes.Structure):
+    _fields_ = [
+        ("biSize", ctypes.c_uint32),
+        ("biWidth", ctypes.c_int32),
+        ("biHeight", ctypes.c_int32),
+        ("biPlanes", ctypes.c_uint16),
+        ("biBitCount", ctypes.c_uint16),
+        ("biCompression", ctypes.c_uint32),
+        ("biSizeImage", ctypes.c_uint32),
+        ("biXPelsPerMeter", ctypes.c_int32),
+        ("biYPelsPerMeter", ctypes.c_int32),
+        ("biClrUsed", ctypes.c_uint32),
+        ("biClrImportant", ctypes.c_uint32),
+    ]
+
+
+def monitor_bbox_at(x, y):
+    # Bildschirm unter dem Punkt (left, top, right, bottom); None ohne Win32.
+    try:
+        user32 = ctypes.windll.user32
+        user32.MonitorFromPoint.restype = ctypes.c_void_p
+        user32.MonitorFromPoint.argtypes = [wintypes.POINT, wintypes.DWORD]
+        monitor = user32.MonitorFromPoint(wintypes.POINT(int(x), int(y)), 2)
+        info = _MONITORINFO()
+        info.cbSize = ctypes.sizeof(_MONITORINFO)
+        if not monitor or not user32.GetMonitorInfoW(ctypes.c_void_p(monitor), ctypes.byref(info)):
+            return None
+        rect = info.rcMonitor
+        return rect.left, rect.top, rect.right, rect.bottom
+    except Exception:
+        return None
+
+
+def exclude_from_capture(hwnd):
+    # Fenster aus Bildschirmaufnahmen ausnehmen (ab Windows 10 2004); False, wenn das
+    # System es nicht kann.
+    try:
+        user32 = ctypes.windll.user32
+        root = user32.GetAncestor(hwnd, 2) or hwnd
+        return bool(user32.SetWindowDisplayAffinity(root, WDA_EXCLUDEFROMCAPTURE))
+    except Exception:
+        return False
+
+
+class PilCaptureBackend:
+    # Portabler Weg ueber PIL.ImageGrab (liefert PIL-Bilder).
+    name = "pil"
+
+    def grab(self, bbox=None):
+        from PIL import ImageGrab
+
+        return ImageGrab.grab(bbox, all_screens=bbox is not None)
+
+    def close(self):
+        pass
+
+
+class GdiCaptureBackend:
+    # Schneller Win32-Weg: BitBlt direkt in eine wiederverwendete DIB-Section (Speicher,
+    # den GDI und Prozess teilen; das Gegenstueck zu XShm unter X11). Die BGRA-Pixel
+    # dekodiert PIL (C-Schleife) direkt aus dem Puffer und rechnet sie in Graustufen um.
+    name = "gdi"
+    SRCCOPY = 0x00CC0020
+    CAPTUREBLT = 0x40000000
+    MAX_BUFFERS = 4
+
+    def __init__(self):
+        self.user32 = ctypes.windll.user32
+        self.gdi32 = ctypes.windll.gdi32
+        self.user32.GetDC.restype = ctypes.c_void_p
+        self.user32.GetDC.argtypes = [ctypes.c_void_p]
+        self.user32.ReleaseDC.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        self.gdi32.CreateCompatibleDC.restype = ctypes.c_void_p
+        self.gdi32.CreateCompatibleDC.argtypes = [ctypes.c_void_p]
+        self.gdi32.CreateDIBSection.restype = ctypes.c_void_p
+        self.gdi32.CreateDIBSection.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            ctypes.c_uint,
+            ctypes.POINTER(ctypes.c_void_p),
+            ctypes.c_void_p,
+            ctypes.c_uint32,
+        ]
+        self.gdi32.SelectObject.restype = ctypes.c_void_p
+        self.gdi32.SelectObject.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        self.gdi32.BitBlt.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_void_p,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_uint32,
+        ]
+        self.gdi32.DeleteObject.argtypes = [ctypes.c_void_p]
+        self.gdi32.DeleteDC.argtypes = [ctypes.c_void_p]
+        self.gdi32.GdiFlush.restype = ctypes.c_int
+        self.lock = threading.Lock()
+        self.buffers = collections.OrderedDict()
+
+    def _buffer(self, width, height):
+        key = (width, height)
+        entry = self.buffers.get(key)
+        if entry is not None:
+            self.buffers.move_to_end(key)
+            return entry
+        header = _BITMAPINFOHEADER()
+        header.biSize = ctypes.sizeof(_BITMAPINFOHEADER)
+        header.biWidth = width
+        header.biHeight = -height
+        header.biPlanes = 1
+        header.biBitCount = 32
+        bits = ctypes.c_void_p()
+        mem_dc = self.gdi32.CreateCompatibleDC(None)
+        bitmap = self.gdi32.CreateDIBSection(mem_dc, ctypes.byref(header), 0, bits, None, 0)
+        if not bitmap or not bits.value:
+            self.gdi32.DeleteDC(mem_dc)
+            raise OSError("CreateDIBSection fehlgeschlagen")
+        self.gdi32.SelectObject(mem_dc, bitmap)
+        entry = (mem_dc, bitmap, bits.value)
+        self.buffers[key] = entry
+        while len(self.buffers) > self.MAX_BUFFERS:
+            self._free(self.buffers.popitem(last=False)[1])
+        return entry
+
+    def _free(self, entry):
+        mem_dc, bitmap, _bits = entry
+        self.gdi32.DeleteObject(bitmap)
+        self.gdi32.DeleteDC(mem_dc)
+
+    def grab(self, bbox=None):
+        import numpy as np
+        from PIL import Image
+
+        if bbox is None:
+            # Virtueller Bildschirm (alle Monitore).
+            left = self.user32.GetSystemMetrics(76)
+            top = self.user32.GetSystemMetrics(77)
+            bbox = (
+                left,
+                top,
+                left + self.user32.GetSystemMetrics(78),
+                top + self.user32.GetSystemMetrics(79),
+            )
+        left, top, right, bottom = (int(v) for v in bbox)
+        width, height = max(1, right - left), max(1, bottom - top)
+        with self.lock:
+            mem_dc, _bitmap, bits = self._buffer(width, height)
+            screen_dc = self.user32.GetDC(None)
+            try:
+                ok = self.gdi32.BitBlt(
+                    mem_dc,
+                    0,
+                    0,
+                    width,
+                    height,
+                    screen_dc,
+                    left,
+                    top,
+                    self.SRCCOPY | self.CAPTUREBLT,
+                )
+            finally:
+                self.user32.ReleaseDC(None, screen_dc)
+            if not ok:
+                raise OSError("BitBlt fehlgeschlagen")
+            # Ausstehende GDI-Operationen abschliessen, bevor die DIB-Bits gelesen werden.
+            self.gdi32.GdiFlush()
+            raw = (ctypes.c_uint8 * (width * height * 4)).from_address(bits)
+            # Ein numpy-Matmul auf uint16 laeuft ohne BLAS und ist bei 4K etwa viermal
+            # langsamer als PILs Rohdekoder; der Puffer wird dabei kopiert und kann danach
+            # wiederverwendet werden.
+            image = Image.frombuffer("RGBA", (width, height), raw, "raw", "BGRA", 0, 1)
+            gray = np.asarray(image.convert("L"))
+        return GrayFrame(gray)
+
+    def close(self):
+        with self.lock:
+            while self.buffers:
+                self._free(self.buffers.popitem()[1])
+
+
+def create_capture_backend(name="auto"):
+    if name in ("auto", "gdi"):
+        try:
+            return GdiCaptureBackend()
+        except Exception:
+            if name == "gdi":
+                raise
+            logging.info("GDI-Aufnahme nicht verfuegbar, nutze PIL.ImageGrab.")
+    return PilCaptureBackend()
+
+
+class TesseractEngine:
+    # Haelt libtesseract ueber die C-API im Prozess geladen. Die Sprachmodelle werden
+    # nur einmal gelesen, Bilder gehen als Pixelpuffer direkt an Tesseract
+    # (kein Prozessstart, keine Temp-Dateien wie bei pytesseract).
+    # Ein TessBaseAPI-Handle ist nicht threadsicher, deshalb gibt es einen kleinen
+    # Pool: jeder parallele OCR-Lauf bekommt sein eigenes Handle.
+    LIBRARY_NAMES = (
+        "libtesseract-5.dll",
+        "libtesseract-5.4.dll",
+        "libtesseract-4.dll",
+        "tesseract50.dll",
+        "libtesseract.so.5",
+        "libtesseract.so.4",
+        "libtesseract.5.dylib",
+    )
+    CANCEL_FUNC = ctypes.CFUNCTYPE(ctypes.c_bool, ctypes.c_void_p, ctypes.c_int)
+
+    def __init__(
+        self,
+        tessdata_dir,
+        tesseract_path=None,
+        max_handles=1,
+        keep_handles=None,
+        idle_seconds=300,
+    ):
+        self.tessdata_dir = Path(tessdata_dir)
+        self.tesseract_path = tesseract_path
+        self.max_handles = max(1, int(max_handles))
+        # Nach einem Druck mit vielen Kacheln nicht alle Handles (je Dutzende MB Modelle)
+        # dauerhaft halten: laenger als idle_seconds freie Handles ueber keep_handles
+        # hinaus werden abgebaut.
+        self.keep_handles = self.max_handles if keep_handles is None else keep_handles
+        self.idle_seconds = idle_seconds
+        self.idle_since = {}
+        self.lib = None
+        self.idle_handles = []
+        self.handle_count = 0
+        self.cond = threading.Condition()
+        self.load_failed = False
+        self.osd_failed = False
+
+    def _library_candidates(self):
+        candidates = []
+        if self.tesseract_path:
+            base = Path(self.tesseract_path).parent
+            for name in self.LIBRARY_NAMES:
+                candidate = base / name
+                if candidate.exists():
+                    candidates.append(str(candidate))
+        found = ctypes.util.find_library("tesseract")
+        if found:
+            candidates.append(found)
+        candidates.extend(self.LIBRARY_NAMES)
+        return candidates
+
+    def _load_library(self):
+        if self.tesseract_path and hasattr(os, "add_dll_directory"):
+            try:
+                os.add_dll_directory(str(Path(self.tesseract_path).parent))
+            except Exception:
+                pass
+
+        for candidate in self._library_candidates():
+            try:
+                lib = ctypes.CDLL(candidate)
+            except OSError:
+                continue
+            self._bind(lib)
+            logging.info("libtesseract geladen: %s", candidate)
+            return lib
+        return None
+
+    def _bind(self, lib):
+        lib.TessBaseAPICreate.restype = ctypes.c_void_p
+        lib.TessBaseAPICreate.argtypes = []
+        lib.TessBaseAPIInit2.restype = ctypes.c_int
+        lib.TessBaseAPIInit2.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_char_p,
+            ctypes.c_char_p,
+            ctypes.c_int,
+        ]
+        lib.TessBaseAPISetPageSegMode.restype = None
+        lib.TessBaseAPISetPageSegMode.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        lib.TessBaseAPISetImage.restype = None
+        lib.TessBaseAPISetImage.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+        ]
+        lib.TessBaseAPIRecognize.restype = ctypes.c_int
+        lib.TessBaseAPIRecognize.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        lib.TessBaseAPIGetTsvText.restype = ctypes.c_void_p
+        lib.TessBaseAPIGetTsvText.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        lib.TessDeleteText.restype = None
+        lib.TessDeleteText.argtypes = [ctypes.c_void_p]
+        lib.TessBaseAPIClear.restype = None
+        lib.TessBaseAPIClear.argtypes = [ctypes.c_void_p]
+        lib.TessBaseAPIEnd.restype = None
+        lib.TessBaseAPIEnd.argtypes = [ctypes.c_void_p]
+        lib.TessBaseAPIDelete.restype = None
+        lib.TessBaseAPIDelete.argtypes = [ctypes.c_void_p]
+        lib.TessBaseAPIDetectOrientationScript.restype = ctypes.c_int
+        lib.TessBaseAPIDetectOrientationScript.argtypes = [
+            ctypes.c_void_p,
+            ctypes.POINTER(ctypes.c_int),
+            ctypes.POINTER(ctypes.c_float),
+            ctypes.POINTER(ctypes.c_char_p),
+            ctypes.POINTER(ctypes.c_float),
+        ]
+        lib.TessMonitorCreate.restype = ctypes.c_void_p
+        lib.TessMonitorCreate.argtypes = []
+        lib.TessMonitorSetCancelFunc.restype = None
+        lib.TessMonitorSetCancelFunc.argtypes = [ctypes.c_void_p, self.CANCEL_FUNC]
+        lib.TessMonitorDelete.restype = None
+        lib.TessMonitorDelete.argtypes = [ctypes.c_void_p]
+
+    def _create_handle(self, lang):
+        # osd.traineddata enthaelt kein LSTM-Modell und braucht die Standard-Engine.
+        oem = OEM_DEFAULT if lang == OSD_LANGUAGE else OEM_LSTM_ONLY
+        handle = self.lib.TessBaseAPICreate()
+        rc = self.lib.TessBaseAPIInit2(
+            handle,
+            str(self.tessdata_dir).encode("utf-8"),
+            lang.encode("utf-8"),
+            oem,
+        )
+        if rc != 0:
+            self.lib.TessBaseAPIDelete(handle)
+            logging.error("libtesseract Init fehlgeschlagen (lang=%s).", lang)
+            return None
+        logging.info("Tesseract-Handle bereit (lang=%s).", lang)
+        return handle
+
+    def _delete_handle(self, handle):
+        self.lib.TessBaseAPIEnd(handle)
+        self.lib.TessBaseAPIDelete(handle)
+
+    def _acquire(self, lang):
+        with self.cond:
+            if self.load_failed:
+                return None
+            if self.lib is None:
+                self.lib = self._load_library()
+                if self.lib is None:
+                    logging.info("libtesseract nicht gefunden, nutze pytesseract.")
+                    self.load_failed = True
+                    return None
+
+            while True:
+                for idx, (handle_lang, handle) in enumerate(self.idle_handles):
+                    if handle_lang == lang:
+                        self.idle_since.pop(handle, None)
+                        return self.idle_handles.pop(idx)
+                if self.handle_count < self.max_handles:
+                    self.handle_count += 1
+                    break
+                if self.idle_handles:
+                    # Handle mit anderer Sprache freigeben und neu initialisieren.
+                    _old_lang, handle = self.idle_handles.pop(0)
+                    self.idle_since.pop(handle, None)
+                    self._delete_handle(handle)
+                    break
+                self.cond.wait()
+
+        handle = self._create_handle(lang)
+        if handle is None:
+            with self.cond:
+                self.handle_count -= 1
+                if lang == OSD_LANGUAGE:
+                    self.osd_failed = True
+                else:
+                    self.load_failed = True
+                self.cond.notify_all()
+            return None
+        return (lang, handle)
+
+    def _release(self, entry):
+        with self.cond:
+            self.idle_handles.append(entry)
+            self.idle_since[entry[1]] = time.monotonic()
+            self.cond.notify()
+
+    def trim_idle(self):
+        # Die zuletzt benutzten keep_handles bleiben, aeltere freie Handles gehen.
+        now = time.monotonic()
+        with self.cond:
+            while len(self.idle_handles) > self.keep_handles:
+                _lang, handle = self.idle_handles[0]
+                if now - self.idle_since.get(handle, now) < self.idle_seconds:
+                    break
+                self.idle_handles.pop(0)
+                self.idle_since.pop(handle, None)
+                self._delete_handle(handle)
+                self.handle_count -= 1
+
+    def _image_buffer(self, image):
+        # Akzeptiert ein PIL-Bild im Modus "L" oder ein 2D-uint8-Array (numpy).
+        # Numpy-Puffer werden ohne Kopie per Zeiger uebergeben.
+        if hasattr(image, "ctypes"):
+            if not image.flags["C_CONTIGUOUS"]:
+                image = image.copy(order="C")
+            height, width = image.shape[:2]
+            data = image.ctypes.data_as(ctypes.c_void_p)
+            return image, data, width, height, image.strides[0]
+
+        if image.mode != "L":
+            image = image.convert("L")
+        width, height = image.size
+        raw = image.tobytes()
+        data = ctypes.cast(ctypes.c_char_p(raw), ctypes.c_void_p)
+        return raw, data, width, height, width
+
+    def recognize_data(self, image, lang, psm, cancel_event=None):
+        # Liefert TSV im Format von pytesseract.image_to_data (ohne Kopfzeile).
+        keepalive, data, width, height, bytes_per_line = self._image_buffer(image)
+        entry = self._acquire(lang)
+        if entry is None:
+            return None
+
+        handle = entry[1]
+        monitor = None
+        cancel_cb = None
+        try:
+            self.lib.TessBaseAPISetPageSegMode(handle, int(psm))
+            self.lib.TessBaseAPISetImage(handle, data, width, height, 1, bytes_per_line)
+            if cancel_event is not None:
+                # Tesseract fragt den Monitor waehrend der Erkennung ab und bricht
+                # ab, sobald ein anderer Lauf schon ein gutes Ergebnis geliefert hat.
+                cancel_cb = self.CANCEL_FUNC(lambda _ctx, _words: cancel_event.is_set())
+                monitor = self.lib.TessMonitorCreate()
+                self.lib.TessMonitorSetCancelFunc(monitor, cancel_cb)
+            if self.lib.TessBaseAPIRecognize(handle, monitor) != 0:
+                return ""
+            if cancel_event is not None and cancel_event.is_set():
+                return ""
+
+            ptr = self.lib.TessBaseAPIGetTsvText(handle, 0)
+            if not ptr:
+                return ""
+            try:
+                return ctypes.string_at(ptr).decode("utf-8", errors="replace")
+            finally:
+                self.lib.TessDeleteText(ptr)
+        finally:
+            self.lib.TessBaseAPIClear(handle)
+            if monitor:
+                self.lib.TessMonitorDelete(monitor)
+            self._release(entry)
+            del keepalive
+
+    def detect_script(self, image):
+        # Liefert (Schriftname, Konfidenz) per OSD oder None, wenn nicht moeglich.
+        if self.osd_failed:
+            return None
+        keepalive, data, width, height, bytes_per_line = self._image_buffer(image)
+        entry = self._acquire(OSD_LANGUAGE)
+        if entry is None:
+            return None
+
+        handle = entry[1]
+        orient_deg = ctypes.c_int(0)
+        orient_conf = ctypes.c_float(0.0)
+        script_name = ctypes.c_char_p()
+        script_conf = ctypes.c_float(0.0)
+        try:
+            self.lib.TessBaseAPISetImage(handle, data, width, height, 1, bytes_per_line)
+            ok = self.lib.TessBaseAPIDetectOrientationScript(
+                handle,
+                ctypes.byref(orient_deg),
+                ctypes.byref(orient_conf),
+                ctypes.byref(script_name),
+                ctypes.byref(script_conf),
+            )
+            if not ok or not script_name.value:
+                return None
+            return script_name.value.decode("utf-8", errors="replace"), float(script_conf.value)
+        finally:
+            self.lib.TessBaseAPIClear(handle)
+            self._release(entry)
+            del keepalive
+
+    @property
+    def available(self):
+        return not self.load_failed
+
+    def close(self):
+        with self.cond:
+            for _lang, handle in self.idle_handles:
+                self._delete_handle(handle)
+            self.handle_count -= len(self.idle_handles)
+            self.idle_handles = []
+            self.idle_since.clear()
+
+
+class OcrResultCache:
+    # Merkt sich OCR-Ergebnisse pro Bildinhalt (Hash der Rohaufnahme + OCR-Einstellungen).
+    # Im Perceptual-Modus wird zusaetzlich ein Differenz-Hash verglichen, damit kleine
+    # Aenderungen wie ein blinkender Cursor trotzdem einen Treffer ergeben. Ein einzelnes
+    # geaendertes Zeichen liegt in derselben Groessenordnung, daher ist der Modus optional.
+    HASH_WIDTH = 128
+
+    def __init__(self, max_entries=64, perceptual=False, max_distance=0.005):
+        self.max_entries = max_entries
+        self.perceptual = perceptual
+        self.max_distance = max_distance
+        self.entries = collections.OrderedDict()
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def _difference_hash(self, image):
+        import numpy as np
+        from PIL import Image
+
+        width = self.HASH_WIDTH
+        height = max(4, min(self.HASH_WIDTH, round(width * image.height / max(1, image.width))))
+        resampling = getattr(Image, "Resampling", Image)
+        gray = Image.fromarray(np.ascontiguousarray(gray_array(image)))
+        small = gray.resize((width + 1, height), resampling.BILINEAR)
+        pixels = small.tobytes()
+        bits = 0
+        for row in range(height):
+            offset = row * (width + 1)
+            for col in range(width):
+                bits = (bits << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+        return bits, width * height
+
+    def make_key(self, image, settings):
+        digest = hashlib.blake2b(image.tobytes(), digest_size=16).hexdigest()
+        exact = (image.mode, image.size, settings, digest)
+        phash = self._difference_hash(image) if self.perceptual else None
+        return exact, phash
+
+    def get(self, key):
+        exact, phash = key
+        with self.lock:
+            result = self.entries.get(exact)
+            if result is None and phash is not None:
+                result = self._find_similar(exact, phash)
+            if result is None:
+                self.stats["misses"] += 1
+                return None
+            self.stats["hits"] += 1
+            return result[0]
+
+    def _find_similar(self, exact, phash):
+        bits, total = phash
+        limit = max(1, int(total * self.max_distance))
+        for other_exact, entry in reversed(self.entries.items()):
+            other_phash = entry[1]
+            if other_phash is None or other_exact[:3] != exact[:3]:
+                continue
+            if bin(bits ^ other_phash[0]).count("1") <= limit:
+                self.entries.move_to_end(other_exact)
+                return entry
+        return None
+
+    def put(self, key, result):
+        exact, phash = key
+        with self.lock:
+            self.entries[exact] = (result, phash)
+            self.entries.move_to_end(exact)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+class TranslationCache:
+    # Zweistufiger Cache vor dem Uebersetzer: LRU im Speicher und SQLite auf der Platte.
+    # Beide Stufen werden nach Anzahl und Alter begrenzt.
+    PRUNE_EVERY = 64
+
+    def __init__(
+        self,
+        db_path,
+        memory_size=512,
+        memory_ttl=6 * 3600,
+        disk_max_entries=20000,
+        disk_ttl=30 * 24 * 3600,
+    ):
+        # db_path=None: nur RAM-Cache (z.B. fuer Batch-Worker).
+        self.db_path = Path(db_path) if db_path else None
+        self.memory_size = memory_size
+        self.memory_ttl = memory_ttl
+        self.disk_max_entries = disk_max_entries
+        self.disk_ttl = disk_ttl
+        self.memory = collections.OrderedDict()
+        self.lock = threading.Lock()
+        self.conn = None
+        self.puts_since_prune = 0
+        # last_used von Disk-Treffern; wird erst beim naechsten put/close geschrieben,
+        # damit ein Lesezugriff kein eigenes UPDATE mit commit() kostet.
+        self.pending_touches = {}
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+        self._open_db()
+
+    def _open_db(self):
+        if self.db_path is None:
+            return
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                "source TEXT NOT NULL, target TEXT NOT NULL, text TEXT NOT NULL, "
+                "translation TEXT NOT NULL, created REAL NOT NULL, last_used REAL NOT NULL, "
+                "PRIMARY KEY (source, target, text))"
+            )
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS translations_last_used ON translations (last_used)"
+            )
+            self.conn.commit()
+            self._prune_disk()
+        except Exception:
+            logging.exception("Uebersetzungs-Cache konnte nicht geoeffnet werden: %s", self.db_path)
+            self.conn = None
+
+    @staticmethod
+    def normalize(text):
+        return re.sub(r"\s+", " ", text or "").strip()
+
+    def get(self, text, source, target):
+        key = (source, target, self.normalize(text))
+        now = time.time()
+        with self.lock:
+            entry = self.memory.get(key)
+            if entry is not None:
+                translation, created = entry
+                if now - created <= self.memory_ttl:
+                    self.memory.move_to_end(key)
+                    self.stats["memory_hits"] += 1
+                    return translation
+                del self.memory[key]
+
+            if self.conn is not None:
+                try:
+                    row = self.conn.execute(
+                        "SELECT translation, created FROM translations "
+                        "WHERE source = ? AND target = ? AND text = ?",
+                        key,
+                    ).fetchone()
+                    if row and now - row[1] <= self.disk_ttl:
+                        self.pending_touches[key] = now
+                        self._remember(key, row[0], now)
+                        self.stats["disk_hits"] += 1
+                        return row[0]
+                except Exception:
+                    logging.exception("Uebersetzungs-Cache Lesefehler.")
+
+            self.stats["misses"] += 1
+            return None
+
+    def put(self, text, source, target, translation):
+        if not translation:
+            return
+        key = (source, target, self.normalize(text))
+        now = time.time()
+        with self.lock:
+            self._remember(key, translation, now)
+            if self.conn is None:
+                return
+            self.pending_touches.pop(key, None)
+            try:
+                self._flush_touches()
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO translations "
+                    "(source, target, text, translation, created, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    key + (translation, now, now),
+                )
+                self.conn.commit()
+                self.puts_since_prune += 1
+                if self.puts_since_prune >= self.PRUNE_EVERY:
+                    self._prune_disk()
+            except Exception:
+                logging.exception("Uebersetzungs-Cache Schreibfehler.")
+
+    def _remember(self, key, translation, created):
+        self.memory[key] = (translation, created)
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_size:
+            self.memory.popitem(last=False)
+
+    def _flush_touches(self):
+        # Ohne commit(); der Aufrufer schreibt es zusammen mit seiner eigenen Aenderung.
+        if not self.pending_touches:
+            return
+        touches = [(used,) + key for key, used in self.pending_touches.items()]
+        self.pending_touches = {}
+        self.conn.executemany(
+            "UPDATE translations SET last_used = ? "
+            "WHERE source = ? AND target = ? AND text = ?",
+            touches,
+        )
+
+    def _prune_disk(self):
+        self.puts_since_prune = 0
+        self._flush_touches()
+        self.conn.execute(
+            "DELETE FROM translations WHERE created < ?",
+            (time.time() - self.disk_ttl,),
+        )
+        self.conn.execute(
+            "DELETE FROM translations WHERE rowid IN ("
+            "SELECT rowid FROM translations ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self.disk_max_entries,),
+        )
+        self.conn.commit()
+
+    def stats_text(self):
+        with self.lock:
+            hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+            return (
+                f"Cache: {hits} Treffer (RAM {self.stats['memory_hits']}, "
+                f"Disk {self.stats['disk_hits']}) | {self.stats['misses']} Fehlgriffe"
+            )
+
+    def close(self):
+        with self.lock:
+            if self.conn is not None:
+                try:
+                    self._flush_touches()
+                    self.conn.commit()
+                except Exception:
+                    logging.exception("Uebersetzungs-Cache Schreibfehler.")
+                self.conn.close()
+                self.conn = None
+
+
+def assess_text(text, languages, target):
+    # Schnelle lokale Einstufung vor der Uebersetzung. Rueckgabe: (Urteil, Kennzahlen) mit
+    # Urteil "noise" (Symbol-/OCR-Salat), "target" (schon in der Zielsprache) oder
+    # "translate". languages: OCR-Sprachen (eng, rus, ...), target: Zielsprache (de, ...).
+    chars = [ch for ch in text if not ch.isspace()]
+    letters = sum(1 for ch in chars if ch.isalpha())
+    words = re.findall(r"[^\W\d_]+", text.lower())
+    ratio = letters / float(len(chars)) if chars else 0.0
+    scores = {"letter_ratio": round(ratio, 2), "words": len(words)}
+    if ratio < TEXT_MIN_LETTER_RATIO or not any(len(word) >= 2 for word in words):
+        return "noise", scores
+
+    target_iso = target.split("-")[0].lower()
+    candidates = {OCR_LANGUAGE_ISO.get(lang, lang) for lang in languages} | {target_iso}
+    hits = {}
+    for lang in sorted(candidates):
+        stopwords = TEXT_STOPWORDS.get(lang)
+        if stopwords:
+            hits[lang] = round(sum(word in stopwords for word in words) / float(len(words)), 2)
+    scores["hits"] = hits
+    target_hits = hits.get(target_iso, 0.0)
+    # Kurze Texte (Buttons, einzelne Woerter) sind zu unsicher und gehen immer raus.
+    if len(words) >= 3 and target_hits >= TEXT_TARGET_MIN_HITS:
+        if target_hits >= max(hits.values()):
+            return "target", scores
+    return "translate", scores
+
+
+def _split_oversized(piece, max_chars):
+    # Zu lange Zeile: erst an Satzenden, dann an Leerzeichen, notfalls hart teilen.
+    for pattern in (r"(?<=[.!?…؟。])\s+", r"\s+"):
+        parts = re.split(f"({pattern})", piece)
+        if len(parts) > 1:
+            return [part for part in parts if part]
+    return [piece[i : i + max_chars] for i in range(0, len(piece), max_chars)]
+
+
+def split_text_chunks(text, max_chars):
+    # Zerlegt Text an Zeilen- und Satzgrenzen in Stuecke von hoechstens max_chars Zeichen.
+    # "".join(Ergebnis) == text, d.h. Trenner (Zeilenumbrueche, Leerzeichen) bleiben
+    # erhalten und die Reihenfolge ist die des Originals.
+    pending = text.splitlines(keepends=True)
+    pending.reverse()
+    chunks = []
+    current = ""
+    while pending:
+        piece = pending.pop()
+        if len(piece) > max_chars:
+            parts = _split_oversized(piece, max_chars)
+            if len(parts) > 1:
+                pending.extend(reversed(parts))
+                continue
+        if current and len(current) + len(piece) > max_chars:
+            chunks.append(current)
+            current = ""
+        current += piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def parse_targets(value):
+    # "de+en, fr" -> ["de", "en", "fr"]; doppelte Angaben fallen weg.
+    targets = []
+    for part in value.replace(",", "+").split("+"):
+        part = part.strip().lower()
+        if part and part not in targets:
+            targets.append(part)
+    return targets
+
+
+def format_translations(translations, labelled=None):
+    # Eine Zielsprache: nur der Text. Mehrere: ein Abschnitt je Sprache. labelled=True
+    # behaelt die Ueberschrift, wenn von mehreren Zielsprachen nur eine uebrig blieb.
+    if labelled is None:
+        labelled = len(translations) > 1
+    if not labelled:
+        return translations[0][1]
+    return "\n\n".join(f"{target.upper()}:\n{text}" for target, text in translations)
+
+
+class GoogleTranslatorBackend:
+    # Online ueber deep_translator; Ergebnisse landen im Uebersetzungs-Cache.
+    name = "google"
+    cacheable = True
+    available = True
+
+    def translate(self, text, source, target):
+        from deep_translator import GoogleTranslator
+
+        return GoogleTranslator(source=source, target=target).translate(text)
+
+    def warm_up(self):
+        # Nur Import und DNS-Aufloesung vorziehen. deep_translator baut bei jedem Aufruf
+        # eine neue Verbindung auf, ein Probe-Request wuerde also nur Kontingent kosten.
+        import socket
+
+        importlib.import_module("deep_translator")
+        socket.getaddrinfo("translate.google.com", 443)
+
+
+class DictionaryTranslatorBackend:
+    # Offline-Uebersetzung Wort fuer Wort bzw. Phrase fuer Phrase aus Woerterbuechern
+    # <quelle>-<ziel>.tsv (je Zeile "Quelltext<TAB>Uebersetzung", # fuer Kommentare).
+    # Laeuft komplett lokal; bei zu geringer Abdeckung gibt es None zurueck, damit die
+    # Richtlinie auf den naechsten Uebersetzer ausweichen kann.
+    name = "dictionary"
+    cacheable = False
+
+    def __init__(self, dictionary_dir, min_coverage=0.6):
+        self.dictionary_dir = Path(dictionary_dir)
+        self.min_coverage = min_coverage
+        self.dictionaries = {}
+        self.lock = threading.Lock()
+
+    @property
+    def available(self):
+        return bool(self._pairs())
+
+    def warm_up(self):
+        for source, target in self._pairs():
+            self._load(source, target)
+
+    def _pairs(self):
+        if not self.dictionary_dir.is_dir():
+            return []
+        pairs = []
+        for path in self.dictionary_dir.glob("*-*.tsv"):
+            source, _sep, target = path.stem.partition("-")
+            pairs.append((source, target))
+        return pairs
+
+    def _load(self, source, target):
+        with self.lock:
+            if (source, target) in self.dictionaries:
+                return self.dictionaries[(source, target)]
+            entries = {}
+            max_words = 1
+            path = self.dictionary_dir / f"{source}-{target}.tsv"
+            if path.exists():
+                for line in path.read_text(encoding="utf-8-sig").splitlines():
+                    if not line.strip() or line.startswith("#") or "\t" not in line:
+                        continue
+                    phrase, translation = line.split("\t", 1)
+                    words = tuple(re.findall(r"\w+", phrase.lower()))
+                    if words:
+                        entries[words] = translation.strip()
+                        max_words = max(max_words, len(words))
+                logging.info("Woerterbuch geladen: %s (%s Eintraege)", path, len(entries))
+            self.dictionaries[(source, target)] = (entries, max_words)
+            return entries, max_words
+
+    def _translate_with(self, text, source, target):
+        entries, max_words = self._load(source, target)
+        tokens = re.findall(r"\w+|\W+", text)
+        words = [(i, tok.lower()) for i, tok in enumerate(tokens) if re.match(r"\w", tok)]
+        if not words:
+            return None, 0.0
+        output = list(tokens)
+        covered = 0
+        pos = 0
+        while pos < len(words):
+            for size in range(min(max_words, len(words) - pos), 0, -1):
+                key = tuple(word for _i, word in words[pos : pos + size])
+                translation = entries.get(key)
+                if translation is None:
+                    continue
+                first, last = words[pos][0], words[pos + size - 1][0]
+                if tokens[first][:1].isupper():
+                    translation = translation[:1].upper() + translation[1:]
+                output[first : last + 1] = [translation] + [""] * (last - first)
+                covered += size
+                pos += size
+                break
+            else:
+                pos += 1
+        return "".join(output), covered / len(words)
+
+    def translate(self, text, source, target):
+        if source == "auto":
+            sources = [src for src, tgt in self._pairs() if tgt == target]
+        else:
+            sources = [source]
+        best, best_coverage = None, 0.0
+        for src in sources:
+            translation, coverage = self._translate_with(text, src, target)
+            if coverage > best_coverage:
+                best, best_coverage = translation, coverage
+        if best_coverage < self.min_coverage:
+            logging.info(
+                "Woerterbuch deckt nur %.0f%% ab (%s->%s).",
+                best_coverage * 100,
+                source,
+                target,
+            )
+            return None
+        return best
+
+
+class FakeTranslatorBackend:
+    # Deterministischer Platzhalter fuer Tests und Benchmarks, ohne Netz.
+    name = "fake"
+    cacheable = False
+    available = True
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+
+    def warm_up(self):
+        pass
+
+    def translate(self, text, source, target):
+        if self.delay:
+            time.sleep(self.delay)
+        return f"[{source}->{target}] {text}"
+
+
+class TranslationCore:
+    # OCR und Uebersetzung ohne Tk, pystray oder Win32. Die Tray-App baut darauf auf,
+    # der Batch-Modus nutzt die Klasse direkt.
+    def __init__(self, ocr_languages=None, tessdata_dir=None, persistent_cache=True):
+        self.ocr_languages = list(ocr_languages or ["eng", "rus", "ukr", "ara"])
+        self.local_tessdata_dir = Path(tessdata_dir) if tessdata_dir else self._local_tessdata_dir()
+        self.available_ocr_languages = []
+        self.tesseract_path = None
+        self.tesseract_ready = False
+        self.ocr_engine = None
+        # Parallel-Modus: alle PSM-Konfigurationen gleichzeitig, Abbruch der uebrigen
+        # sobald ein Ergebnis die Qualitaetsschwelle (Konfidenz 0..100) erreicht.
+        self.ocr_parallel = True
+        self.ocr_workers = max(1, min(len(OCR_CONFIGS), os.cpu_count() or 1))
+        self.ocr_quality_threshold = 85
+        self.ocr_min_chars = 8
+        self.ocr_pool = None
+        # Maus-, Fenster- und Fullscreen-OCR gleichzeitig statt nacheinander; gewinnt das
+        # Ergebnis mit hoechster Prioritaet, das mindestens ocr_escalate_chars Zeichen hat.
+        self.ocr_concurrent_regions = True
+        self.ocr_region_workers = 3
+        self.region_pool = None
+        # Grosse Aufnahmen an leeren Zeilen in Baender teilen und parallel erkennen; pro
+        # Band laufen die PSM-Konfigurationen dann nacheinander.
+        self.ocr_tiling = True
+        self.ocr_tile_min_pixels = 400_000
+        self.ocr_tile_workers = os.cpu_count() or 1
+        self.tile_pool = None
+        # So viele Handles, wie gleichzeitig gehalten werden koennen (PSM-, Kachel- und
+        # Regionen-Threads), damit kein Druck Sprachmodelle verdraengt und neu laedt.
+        self.ocr_max_handles = self.ocr_workers + self.ocr_tile_workers + self.ocr_region_workers
+        # Dauerhaft gehalten nur, was ein Druck im Mausbereich braucht (PSMs + OSD).
+        self.ocr_keep_handles = self.ocr_workers + 1
+        self.ocr_binarize = True
+        # Standardprofil; ein mit --autotune gespeichertes Profil ersetzt diese Werte.
+        self.ocr_configs = OCR_CONFIGS
+        self.ocr_scale = None
+        self.ocr_escalate_chars = 8
+        # Vor der Erkennung die Schrift per OSD bestimmen und nur passende Modelle laden.
+        self.ocr_script_detection = True
+        self.osd_available = False
+        # Grosse Aufnahmen (Fenster/Fullscreen) vorher auf Textbloecke zuschneiden.
+        self.text_detection = True
+        self.text_detect_min_pixels = 400_000
+        self.text_detect_max_coverage = 0.6
+        self.ocr_cache = OcrResultCache(max_entries=64, perceptual=False)
+        self.tracer = LatencyTracer()
+        self.translation_source = "auto"
+        # Erste Zielsprache ist die primaere (Beobachtungsmodus, Batch-Feld "translation").
+        self.translation_targets = ["de"]
+        self.translation_policy = "online"
+        # Lange Texte (Fenster-/Fullscreen-OCR) in Stuecke teilen und parallel uebersetzen.
+        self.translation_chunk_chars = 1500
+        self.translation_workers = 4
+        self.translation_pool = None
+        # Eigener Pool je Zielsprache, damit die Sprach-Jobs nicht auf ihre Stuecke im
+        # translation_pool warten muessen.
+        self.target_pool = None
+        # Symbolsalat nicht uebersetzen, Text in der Zielsprache unveraendert zurueckgeben.
+        self.text_quality_gate = True
+        self.translation_backends = {
+            "google": GoogleTranslatorBackend(),
+            "dictionary": DictionaryTranslatorBackend(
+                self.local_tessdata_dir.parent / "dictionaries"
+            ),
+            "fake": FakeTranslatorBackend(),
+        }
+        self.translation_cache = TranslationCache(
+            self.local_tessdata_dir.parent / "translation_cache.sqlite3"
+            if persistent_cache
+            else None
+        )
+        self.ocr_profile = self.load_ocr_profile()
+
+    def _local_tessdata_dir(self):
+        base = Path(os.getenv("LOCALAPPDATA", str(Path.home())))
+        return base / "Transilvania" / "tessdata"
+
+    def _system_tessdata_dir(self):
+        if not self.tesseract_path:
+            return None
+        candidate = Path(self.tesseract_path).parent / "tessdata"
+        if candidate.exists():
+            return candidate
+        return None
+
+    def _resolve_tesseract_path(self):
+        candidates = [
+            Path(r"C:\Program Files\Tesseract-OCR\tesseract.exe"),
+            Path(r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe"),
+        ]
+
+        for candidate in candidates:
+            if candidate.exists():
+                return str(candidate)
+
+        path_hit = shutil.which("tesseract")
+        if path_hit:
+            return path_hit
+
+        return None
+
+    def setup_tesseract(self):
+        import pytesseract
+
+        self.tesseract_path = self._resolve_tesseract_path()
+        if not self.tesseract_path:
+            logging.warning("Tesseract nicht gefunden.")
+            return False
+        pytesseract.pytesseract.tesseract_cmd = self.tesseract_path
+        logging.info("Tesseract gefunden: %s", self.tesseract_path)
+        return True
+
+    def init_ocr_engine(self):
+        self.ocr_engine = TesseractEngine(
+            self.local_tessdata_dir,
+            self.tesseract_path,
+            max_handles=self.ocr_max_handles,
+            keep_handles=self.ocr_keep_handles,
+        )
+
+    def _scan_ocr_languages(self):
+        return [
+            lang
+            for lang in self.ocr_languages
+            if (self.local_tessdata_dir / f"{lang}.traineddata").exists()
+        ]
+
+    def ensure_ocr_languages(self, progress=None):
+        # progress(lang, erledigte Bytes, Gesamtbytes oder None, Status) wird aus den
+        # Download-Threads aufgerufen.
+        self.local_tessdata_dir.mkdir(parents=True, exist_ok=True)
+        self.available_ocr_languages = self._scan_ocr_languages()
+        missing = []
+        system_tess = self._system_tessdata_dir()
+
+        wanted = list(self.ocr_languages)
+        if self.ocr_script_detection:
+            wanted.append(OSD_LANGUAGE)
+        for lang in wanted:
+            local_file = self.local_tessdata_dir / f"{lang}.traineddata"
+            if local_file.exists():
+                continue
+
+            if system_tess:
+                system_file = system_tess / f"{lang}.traineddata"
+                if system_file.exists():
+                    part_file = local_file.with_name(local_file.name + ".part")
+                    shutil.copy2(system_file, part_file)
+                    os.replace(part_file, local_file)
+                    logging.info("Sprache aus System uebernommen: %s", lang)
+                    continue
+
+            missing.append(lang)
+
+        def fetch(lang):
+            # Fertige Sprachen sofort freigeben, nicht erst nach dem letzten Download.
+            if self._download_lang(lang, session, progress):
+                self.available_ocr_languages = self._scan_ocr_languages()
+
+        if missing:
+            import requests
+            import requests.adapters
+
+            # Gemeinsamer Verbindungspool fuer alle parallelen Downloads.
+            with requests.Session() as session:
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=TESSDATA_DOWNLOAD_WORKERS,
+                    pool_maxsize=TESSDATA_DOWNLOAD_WORKERS,
+                )
+                session.mount("https://", adapter)
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=min(TESSDATA_DOWNLOAD_WORKERS, len(missing)),
+                    thread_name_prefix="tessdata",
+                ) as pool:
+                    list(pool.map(fetch, missing))
+
+        available = []
+        unresolved = []
+        for lang in self.ocr_languages:
+            traineddata = self.local_tessdata_dir / f"{lang}.traineddata"
+            if traineddata.exists():
+                available.append(lang)
+            else:
+                unresolved.append(lang)
+
+        self.available_ocr_languages = available
+        self.osd_available = (self.local_tessdata_dir / f"{OSD_LANGUAGE}.traineddata").exists()
+        if unresolved:
+            logging.warning(
+                "OCR Sprachdateien fehlen weiterhin: %s",
+                "+".join(unresolved),
+            )
+        if not self.available_ocr_languages:
+            logging.error("Keine OCR Sprachdateien verfuegbar.")
 
-logging.basicConfig(
-    filename="transilvania.log",
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-)
+        logging.info(
+            "OCR Sprachordner: %s | Verfuegbar: %s",
+            self.local_tessdata_dir,
+            "+".join(self.available_ocr_languages) or "keine",
+        )
+
+    def _tessdata_metadata(self, name, session):
+        # Groesse und Git-Blob-SHA1 aus der GitHub-API; ohne API nur Groessenpruefung.
+        try:
+            resp = session.get(TESSDATA_API_URL.format(name=name), timeout=10)
+            resp.raise_for_status()
+            info = resp.json()
+            return int(info["size"]), info.get("sha")
+        except Exception:
+            logging.info("Keine Metadaten fuer %s, pruefe nur die Groesse.", name)
+            return None, None
+
+    @staticmethod
+    def _git_blob_sha1(path):
+        digest = hashlib.sha1(b"blob %d\0" % path.stat().st_size)
+        with open(path, "rb") as fh:
+            for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _download_lang(self, lang, session=None, progress=None):
+        import requests
+
+        session = session or requests
+        name = f"{lang}.traineddata"
+        url = TESSDATA_URL.format(name=name)
+        target = self.local_tessdata_dir / name
+        part_file = target.with_name(name + ".part")
+        expected_size, expected_sha = self._tessdata_metadata(name, session)
+        report = progress or (lambda *_args: None)
+
+        for attempt in range(1, TESSDATA_DOWNLOAD_ATTEMPTS + 1):
+            try:
+                offset = part_file.stat().st_size if part_file.exists() else 0
+                if expected_size is not None and offset > expected_size:
+                    part_file.unlink()
+                    offset = 0
+
+                total = expected_size
+                if expected_size is None or offset < expected_size:
+                    headers = {"Range": f"bytes={offset}-"} if offset else {}
+                    logging.info("Lade Sprache herunter: %s (ab Byte %s)", lang, offset)
+                    with session.get(url, headers=headers, timeout=(10, 60), stream=True) as resp:
+                        if resp.status_code == 416:
+                            pass
+                        else:
+                            resp.raise_for_status()
+                            if offset and resp.status_code != 206:
+                                offset = 0
+                            if total is None and resp.headers.get("Content-Length"):
+                                total = offset + int(resp.headers["Content-Length"])
+                            done = offset
+                            with open(part_file, "ab" if offset else "wb") as fh:
+                                for chunk in resp.iter_content(chunk_size=1024 * 256):
+                                    if chunk:
+                                        fh.write(chunk)
+                                        done += len(chunk)
+                                        report(lang, done, total, "download")
+
+                size = part_file.stat().st_size
+                if total is not None and size != total:
+                    raise IOError(f"Groesse {size} statt {total} Bytes")
+                if expected_sha and self._git_blob_sha1(part_file) != expected_sha:
+                    part_file.unlink()
+                    raise IOError("Pruefsumme stimmt nicht")
+
+                os.replace(part_file, target)
+                report(lang, size, size, "ok")
+                logging.info("Sprache installiert: %s", lang)
+                return True
+            except Exception:
+                logging.exception(
+                    "Download fehlgeschlagen fuer Sprache: %s (Versuch %s/%s)",
+                    lang,
+                    attempt,
+                    TESSDATA_DOWNLOAD_ATTEMPTS,
+                )
+        report(lang, 0, None, "error")
+        return False
+
+    def _ocr_profile_path(self):
+        return self.local_tessdata_dir.parent / OCR_PROFILE_NAME
+
+    def load_ocr_profile(self):
+        path = self._ocr_profile_path()
+        if not path.exists():
+            return None
+        try:
+            profile = json.loads(path.read_text(encoding="utf-8"))
+            self.apply_ocr_profile(profile)
+        except Exception:
+            logging.exception("OCR-Profil %s ungueltig, nutze Standardwerte.", path)
+            return None
+        logging.info("OCR-Profil geladen: %s", describe_ocr_profile(profile))
+        return profile
+
+    def apply_ocr_profile(self, profile):
+        configs = tuple(profile["configs"])
+        scale = profile.get("scale")
+        if not configs or not all(isinstance(cfg, str) for cfg in configs):
+            raise ValueError(f"Ungueltige OCR-Konfigurationen: {configs!r}")
+        if scale is not None and not OCR_MIN_SCALE <= float(scale) <= OCR_MAX_SCALE:
+            raise ValueError(f"Ungueltige Skalierung: {scale!r}")
+        self.ocr_configs = configs
+        self.ocr_scale = scale
+        self.ocr_binarize = bool(profile.get("binarize", True))
+        self.ocr_escalate_chars = int(profile.get("escalate_chars", self.ocr_escalate_chars))
+
+    def _auto_ocr_scale(self, line_height, pixel_count, image_height=None):
+        if not line_height:
+            # Keine Zeilen gefunden: kleine Ausschnitte wie bisher vergroessern, grosse
+            # Aufnahmen nicht noch zusaetzlich aufblasen.
+            return OCR_SCALE if pixel_count < self.text_detect_min_pixels else 1
+        scale = min(OCR_MAX_SCALE, max(OCR_MIN_SCALE, OCR_TARGET_LINE_HEIGHT / line_height))
+        if image_height and line_height > image_height / 2:
+            # Eine "Zeile" ueber den Grossteil der Bildhoehe ist eher Rahmen oder Flaeche
+            # als Schrift; darauf nie verkleinern.
+            scale = max(1, scale)
+        if 0.85 <= scale <= 1.25:
+            return 1
+        return round(scale * 4) / 4
+
+    def _preprocess_for_ocr(self, image, scale=None):
+        # Graustufen -> Skalierung nach geschaetzter Zeilenhoehe -> Kontrast per LUT ->
+        # adaptive Binarisierung (lokaler Mittelwert). Ergebnis ist ein zusammenhaengendes
+        # uint8-Array mit dunklem Text auf hellem Grund, das ohne Kopie an Tesseract geht.
+        import numpy as np
+        from PIL import Image, ImageFilter
+
+        pixels = gray_array(image)
+        gray = None
+        line_height, background = estimate_text_height(pixels)
+        if scale is None:
+            scale = self.ocr_scale
+        if scale is None:
+            scale = self._auto_ocr_scale(line_height, pixels.size, pixels.shape[0])
+
+        if scale != 1:
+            resampling = getattr(Image, "Resampling", Image)
+            method = resampling.LANCZOS if scale > 1 else resampling.BOX
+            size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+            gray = Image.fromarray(np.ascontiguousarray(pixels)).resize(size, method)
+            pixels = np.asarray(gray)
+
+        if not self.ocr_binarize:
+            low, high = int(pixels.min()), int(pixels.max())
+            if high <= low:
+                return np.ascontiguousarray(pixels)
+            lut = np.clip((np.arange(256) - low) * (255.0 / (high - low)), 0, 255).astype(np.uint8)
+            if background < 128:
+                lut = 255 - lut
+            return lut[pixels]
+
+        radius = max(8, int(round((line_height or OCR_TARGET_LINE_HEIGHT / scale) * scale)))
+        if gray is None:
+            gray = Image.fromarray(np.ascontiguousarray(pixels))
+        local_mean = np.asarray(gray.filter(ImageFilter.BoxBlur(radius)), dtype=np.int16)
+        diff = pixels.astype(np.int16)
+        diff -= local_mean
+        # Schwelle an das Bildrauschen anpassen (MAD der Abweichung vom lokalen Mittel).
+        noise = 1.4826 * float(np.median(np.abs(diff[::2, ::2])))
+        offset = min(40, max(OCR_BINARIZE_OFFSET, int(2 * noise)))
+        if background < 128:
+            text_mask = diff > offset
+        else:
+            text_mask = diff < -offset
+        result = np.full(pixels.shape, 255, dtype=np.uint8)
+        result[text_mask] = 0
+        return result
+
+    def _ocr_settings_key(self):
+        return (
+            "+".join(self.available_ocr_languages),
+            self.ocr_configs,
+            self.ocr_scale or "auto",
+            OCR_TARGET_LINE_HEIGHT,
+            self.ocr_binarize,
+        )
+
+    def _extract_ocr_result(self, image, cancel_event=None, parallel_configs=True):
+        cache_key = self.ocr_cache.make_key(image, self._ocr_settings_key())
+        cached = self.ocr_cache.get(cache_key)
+        self.tracer.annotate(size=f"{image.width}x{image.height}", cache_hit=cached is not None)
+        if cached is not None:
+            logging.info("OCR-Ergebnis aus Cache (%sx%s).", image.width, image.height)
+            return cached
+
+        processed = self._preprocess_for_ocr(image)
+        result = self._extract_text_multi_config(processed, cancel_event, parallel_configs)
+        result = result.rescaled(image.width / float(processed.shape[1]))
+        if cancel_event is None or not cancel_event.is_set():
+            self.ocr_cache.put(cache_key, result)
+        return result
+
+    def _extract_ocr_result_blocks(self, image, cancel_event=None, gate=None):
+        # gate: Region mit niedrigerer Prioritaet; sie nutzt den PSM-Pool nicht und startet
+        # ihre Kacheln erst, wenn gate gesetzt ist (siehe _ocr_regions_concurrent).
+        parallel = gate is None
+        tiled = self.ocr_tiling and image.width * image.height >= self.ocr_tile_min_pixels
+        if not self.text_detection or image.width * image.height < self.text_detect_min_pixels:
+            if tiled:
+                return self._extract_ocr_result_tiled(image, cancel_event=cancel_event, gate=gate)
+            return self._extract_ocr_result(image, cancel_event, parallel)
+
+        with self.tracer.span("detect_text") as span:
+            blocks = detect_text_blocks(image)
+            block_area = sum((r - l) * (b - t) for l, t, r, b in blocks)
+            span["blocks"] = len(blocks)
+            span["coverage"] = round(block_area / float(image.width * image.height), 3)
+
+        # Nichts gefunden (schwacher Kontrast, Kantenglaettung) oder fast alles Text: dann
+        # das ganze Bild erkennen statt gar nichts.
+        if not blocks or block_area > self.text_detect_max_coverage * image.width * image.height:
+            blocks = None
+        if self.ocr_tiling:
+            return self._extract_ocr_result_tiled(image, blocks, cancel_event, gate)
+        if blocks is None:
+            return self._extract_ocr_result(image, cancel_event, parallel)
+
+        parts = []
+        for box in blocks:
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            result = self._extract_ocr_result(image.crop(box), cancel_event, parallel)
+            if result.words:
+                parts.append((result, box))
+        return OcrResult.merge([(result, box[:2]) for result, box in order_for_reading(parts)])
+
+    def _get_tile_pool(self):
+        if self.tile_pool is None:
+            self.tile_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.ocr_tile_workers,
+                thread_name_prefix="ocr-tile",
+            )
+        return self.tile_pool
+
+    def _ocr_tile_job(self, trace, image, cancel_event):
+        with self.tracer.attach(trace):
+            with self.tracer.span("ocr_tile") as span:
+                result = self._extract_ocr_result(image, cancel_event, parallel_configs=False)
+                span["chars"] = len(result.text)
+        return result
+
+    def _extract_ocr_result_tiled(self, image, blocks=None, cancel_event=None, gate=None):
+        # Jeder Block (ohne Textbloecke: das ganze Bild) wird anteilig zu seiner Flaeche in
+        # Baender geteilt; alle Baender laufen parallel. Danach pro Block von oben nach unten
+        # zusammensetzen und die Bloecke in Lesereihenfolge (inkl. RTL) anordnen.
+        blocks = blocks or [(0, 0, image.width, image.height)]
+        total_area = float(sum((r - l) * (b - t) for l, t, r, b in blocks)) or 1.0
+        boxes = []
+        with self.tracer.span("split_bands") as span:
+            for index, (left, top, right, bottom) in enumerate(blocks):
+                share = (right - left) * (bottom - top) / total_area
+                parts = max(1, round(self.ocr_tile_workers * share))
+                gray = gray_array(image.crop((left, top, right, bottom)))
+                for band_top, band_bottom in split_into_bands(gray, parts):
+                    boxes.append((index, (left, top + band_top, right, top + band_bottom)))
+            span["bands"] = len(boxes)
+
+        if len(boxes) == 1:
+            result = self._extract_ocr_result(image.crop(boxes[0][1]), cancel_event, gate is None)
+            return OcrResult.merge([(result, boxes[0][1][:2])])
+
+        if gate is not None:
+            with self.tracer.span("wait_priority"):
+                while not gate.wait(0.02):
+                    if cancel_event is not None and cancel_event.is_set():
+                        return OcrResult()
+
+        trace = self.tracer.current()
+        pool = self._get_tile_pool()
+        futures = [
+            pool.submit(self._ocr_tile_job, trace, image.crop(box), cancel_event)
+            for _index, box in boxes
+        ]
+        per_block = collections.defaultdict(list)
+        try:
+            for (index, box), future in zip(boxes, futures):
+                result = future.result()
+                if result.words:
+                    block = blocks[index]
+                    per_block[index].append((result, (box[0] - block[0], box[1] - block[1])))
+        finally:
+            for future in futures:
+                future.cancel()
+
+        parts = [(OcrResult.merge(per_block[index]), blocks[index]) for index in per_block]
+        return OcrResult.merge([(result, box[:2]) for result, box in order_for_reading(parts)])
+
+    def _psm_from_config(self, cfg):
+        match = re.search(r"--psm\s+(\d+)", cfg)
+        return int(match.group(1)) if match else 3
+
+    def _run_ocr_config(self, processed_image, cfg, lang, cancel_event=None):
+        import pytesseract
+
+        if cancel_event is not None and cancel_event.is_set():
+            return OcrResult(config=cfg)
+
+        if self.ocr_engine and self.ocr_engine.available:
+            try:
+                tsv = self.ocr_engine.recognize_data(
+                    processed_image,
+                    lang,
+                    self._psm_from_config(cfg),
+                    cancel_event=cancel_event,
+                )
+                if tsv is not None:
+                    return OcrResult.from_tsv(tsv, cfg)
+            except Exception:
+                logging.exception("In-Process-OCR fehlgeschlagen, nutze pytesseract: %s", cfg)
+
+        tessdata_dir = str(self.local_tessdata_dir)
+        try:
+            tsv = pytesseract.image_to_data(
+                processed_image,
+                lang=lang,
+                config=f"{cfg} --tessdata-dir {tessdata_dir}",
+            )
+            return OcrResult.from_tsv(tsv, cfg)
+        except Exception:
+            logging.exception("OCR-Konfiguration fehlgeschlagen: %s", cfg)
+            try:
+                tsv = pytesseract.image_to_data(
+                    processed_image,
+                    lang=lang,
+                    config=cfg,
+                )
+                return OcrResult.from_tsv(tsv, cfg)
+            except Exception:
+                return OcrResult(config=cfg)
+
+    def _get_ocr_pool(self):
+        if self.ocr_pool is None:
+            self.ocr_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.ocr_workers,
+                thread_name_prefix="ocr",
+            )
+        return self.ocr_pool
+
+    def _ocr_good_enough(self, result):
+        return (
+            result.confidence >= self.ocr_quality_threshold
+            and result.char_count >= self.ocr_min_chars
+        )
+
+    def _detect_script(self, processed_image):
+        import pytesseract
+
+        in_process_failed = False
+        if self.ocr_engine and self.ocr_engine.available:
+            try:
+                detected = self.ocr_engine.detect_script(processed_image)
+                if detected is not None or not self.ocr_engine.osd_failed:
+                    return detected
+            except Exception:
+                logging.exception("In-Process-OSD fehlgeschlagen, nutze pytesseract.")
+            in_process_failed = True
+
+        try:
+            osd = pytesseract.image_to_osd(
+                processed_image,
+                config=f"--psm 0 --tessdata-dir {self.local_tessdata_dir}",
+            )
+        except Exception as exc:
+            # Zu wenig Text fuer OSD ist der Normalfall bei kleinen Ausschnitten. Scheitert
+            # aber auch der Ersatzweg ueber einen eigenen Prozess, nicht bei jedem Druck
+            # erneut versuchen.
+            content = "Too few characters" in str(exc) or "Invalid resolution" in str(exc)
+            if in_process_failed or not content:
+                logging.warning("OSD nicht nutzbar, Schrifterkennung abgeschaltet: %s", exc)
+                self.osd_available = False
+            return None
+        script = re.search(r"Script:\s*(\S+)", osd)
+        conf = re.search(r"Script confidence:\s*([\d.]+)", osd)
+        if not script:
+            return None
+        return script.group(1), float(conf.group(1)) if conf else 0.0
+
+    def _select_ocr_lang(self, processed_image):
+        combined = "+".join(self.available_ocr_languages)
+        if not (self.ocr_script_detection and self.osd_available):
+            return combined
+        scripts = {
+            script
+            for script, langs in OCR_SCRIPT_LANGUAGES.items()
+            if any(lang in self.available_ocr_languages for lang in langs)
+        }
+        if len(scripts) < 2:
+            return combined
+
+        with self.tracer.span("detect_script") as span:
+            detected = self._detect_script(processed_image)
+            span["script"] = detected[0] if detected else None
+        if not detected or detected[1] < OCR_SCRIPT_MIN_CONFIDENCE:
+            return combined
+        langs = [
+            lang
+            for lang in OCR_SCRIPT_LANGUAGES.get(detected[0], ())
+            if lang in self.available_ocr_languages
+        ]
+        if not langs:
+            return combined
+        logging.info("Schrift erkannt: %s (%.2f) -> %s", detected[0], detected[1], "+".join(langs))
+        return "+".join(langs)
+
+    def _extract_text_multi_config(self, processed_image, cancel_event=None, parallel=True):
+        configs = self.ocr_configs
+        lang = self._select_ocr_lang(processed_image)
+        if parallel and self.ocr_parallel and self.ocr_workers > 1 and len(configs) > 1:
+            return self._extract_text_parallel(processed_image, configs, lang, cancel_event)
+
+        best = OcrResult()
+        for cfg in configs:
+            result = self._run_ocr_config(processed_image, cfg, lang, cancel_event)
+            if result.words and result.better_than(best):
+                best = result
+        return best
+
+    def _extract_text_parallel(self, processed_image, configs, lang, parent_cancel=None):
+        # Ctypes gibt den GIL waehrend der Tesseract-Aufrufe frei, Threads reichen
+        # also, um die Konfigurationen auf mehrere Kerne zu verteilen.
+        cancel_event = CancelToken(parent_cancel)
+        pool = self._get_ocr_pool()
+        futures = [
+            pool.submit(self._run_ocr_config, processed_image, cfg, lang, cancel_event)
+            for cfg in configs
+        ]
+        best = OcrResult()
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                result = future.result()
+                if result.words and result.better_than(best):
+                    best = result
+                if self._ocr_good_enough(result):
+                    logging.info(
+                        "OCR Early-Exit mit Konfiguration: %s (Konfidenz %.1f)",
+                        result.config,
+                        result.confidence,
+                    )
+                    break
+        finally:
+            cancel_event.set()
+            for future in futures:
+                future.cancel()
+        return best
+
+    def _check_text(self, text, target=None):
+        if not self.text_quality_gate:
+            return "translate"
+        with self.tracer.span("text_check") as span:
+            verdict, scores = assess_text(
+                text,
+                self.available_ocr_languages or self.ocr_languages,
+                target or self.translation_targets[0],
+            )
+            span["verdict"] = verdict
+        logging.info("Textpruefung: %s %s", verdict, scores)
+        return verdict
+
+    def warm_up(self):
+        # Kleine synthetische Erkennung pro Sprachkombination, damit die LSTM-Modelle in
+        # den Handle-Pools liegen, dazu ein Probelauf der Uebersetzer der Richtlinie.
+        # Rueckgabe: Dauer pro Teil in ms.
+        import numpy as np
+
+        timings = {}
+        if self.tesseract_ready and self.available_ocr_languages:
+            start = time.perf_counter()
+            image = np.full((48, 160), 255, dtype=np.uint8)
+            image[16:32, 16:144:6] = 0
+            combined = "+".join(self.available_ocr_languages)
+            combos = []
+            for langs in OCR_SCRIPT_LANGUAGES.values():
+                combo = "+".join(lang for lang in langs if lang in self.available_ocr_languages)
+                if combo and combo != combined and combo not in combos:
+                    combos.append(combo)
+            # Nur so viele Kombinationen, wie der Pool dauerhaft behaelt (ocr_keep_handles);
+            # sonst verdraengen die spaeteren die frueheren oder trim_idle baut sie wieder
+            # ab. Der Pool gibt zuerst das am laengsten freie Handle ab, daher OSD zuerst und
+            # die kombinierte Sprache zuletzt.
+            osd = self.ocr_script_detection and self.osd_available
+            per_combo = max(1, min(len(self.ocr_configs), self.ocr_workers))
+            slots = (self.ocr_keep_handles - (1 if osd else 0)) // per_combo - 1
+            combos = combos[: max(0, slots)] + [combined]
+            if osd:
+                self._detect_script(image)
+            for lang in combos:
+                self._extract_text_parallel(image, self.ocr_configs, lang)
+            timings["ocr_ms"] = _elapsed_ms(start)
+
+        start = time.perf_counter()
+        for name in TRANSLATION_POLICIES[self.translation_policy]:
+            backend = self.translation_backends[name]
+            if backend.available:
+                try:
+                    backend.warm_up()
+                except Exception:
+                    logging.exception("Warm-up fuer Uebersetzer %s fehlgeschlagen.", name)
+        timings["translate_ms"] = _elapsed_ms(start)
+        return timings
+
+    def _get_translation_pool(self):
+        if self.translation_pool is None:
+            self.translation_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.translation_workers,
+                thread_name_prefix="translate-chunk",
+            )
+        return self.translation_pool
+
+    def _get_target_pool(self):
+        if self.target_pool is None:
+            self.target_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=4,
+                thread_name_prefix="translate-target",
+            )
+        return self.target_pool
+
+    def translate_targets(self, text, cancel_event=None):
+        # Alle Zielsprachen gleichzeitig; Cache und Pools teilen sie sich. Rueckgabe als
+        # Liste (Sprache, Text) in der eingestellten Reihenfolge. Fehlgeschlagene
+        # Zielsprachen werden geloggt und ausgelassen; Fehler nur, wenn alle scheitern.
+        targets = list(self.translation_targets)
+        if len(targets) == 1:
+            return [(targets[0], self._translate_for_target(text, targets[0], cancel_event))]
+
+        trace = self.tracer.current()
+        futures = [
+            self._get_target_pool().submit(self._target_job, trace, text, target, cancel_event)
+            for target in targets
+        ]
+        try:
+            results = []
+            first_error = None
+            for target, future in zip(targets, futures):
+                if cancel_event is not None and cancel_event.is_set():
+                    raise JobCancelled()
+                try:
+                    results.append((target, future.result()))
+                except JobCancelled:
+                    raise
+                except Exception as exc:
+                    logging.exception("Uebersetzung nach %s fehlgeschlagen.", target)
+                    first_error = first_error or exc
+        finally:
+            for future in futures:
+                future.cancel()
+        if not results and first_error is not None:
+            raise first_error
+        return results
+
+    def _target_job(self, trace, text, target, cancel_event):
+        with self.tracer.attach(trace):
+            with self.tracer.span(f"translate_{target}"):
+                return self._translate_for_target(text, target, cancel_event)
+
+    def _translate_for_target(self, text, target, cancel_event=None):
+        if self._check_text(text, target) == "target":
+            logging.info("Text ist bereits in der Zielsprache %s.", target)
+            return text
+        return self._translate_text(text, cancel_event, target)
+
+    def _translate_text(self, text, cancel_event=None, target=None):
+        target = target or self.translation_targets[0]
+        if len(text) <= self.translation_chunk_chars:
+            return self._translate_chunk(text, target)
+
+        chunks = split_text_chunks(text, self.translation_chunk_chars)
+        self.tracer.annotate(chars=len(text), chunks=len(chunks))
+        logging.info("Uebersetze %s Zeichen in %s Stuecken.", len(text), len(chunks))
+        futures = []
+        for chunk in chunks:
+            body = chunk.strip()
+            if body:
+                futures.append(
+                    self._get_translation_pool().submit(self._translate_chunk, body, target)
+                )
+            else:
+                futures.append(None)
+        try:
+            parts = []
+            for chunk, future in zip(chunks, futures):
+                if future is None:
+                    parts.append(chunk)
+                    continue
+                # Fuehrende/abschliessende Leerzeichen und Umbrueche des Originals behalten.
+                if cancel_event is not None and cancel_event.is_set():
+                    raise JobCancelled()
+                body = chunk.strip()
+                start = chunk.index(body)
+                parts.append(chunk[:start] + future.result() + chunk[start + len(body) :])
+        finally:
+            for future in futures:
+                if future is not None:
+                    future.cancel()
+        return "".join(parts)
+
+    def _translate_chunk(self, text, target):
+        source = self.translation_source
+        cached = self.translation_cache.get(text, source, target)
+        self.tracer.annotate(chars=len(text), cache_hit=cached is not None)
+        if cached is not None:
+            logging.info("Uebersetzung aus Cache.")
+            return cached
+
+        last_error = None
+        for name in TRANSLATION_POLICIES[self.translation_policy]:
+            backend = self.translation_backends[name]
+            if not backend.available:
+                continue
+            try:
+                translation = backend.translate(text, source, target)
+            except Exception as exc:
+                logging.exception("Uebersetzer %s fehlgeschlagen.", name)
+                last_error = exc
+                continue
+            if not translation:
+                continue
+            self.tracer.annotate(backend=name)
+            if backend.cacheable:
+                self.translation_cache.put(text, source, target, translation)
+            return translation
+
+        if last_error is not None:
+            raise last_error
+        raise RuntimeError(f"Kein Uebersetzer lieferte ein Ergebnis ({self.translation_policy}).")
+
+    def _get_region_pool(self):
+        # Eigener Pool, damit Regionen-Jobs nicht auf PSM-Jobs im selben Pool warten.
+        if self.region_pool is None:
+            self.region_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.ocr_region_workers,
+                thread_name_prefix="ocr-region",
+            )
+        return self.region_pool
+
+    def _ocr_region_job(self, trace, name, image, cancel_event, gate=None):
+        with self.tracer.attach(trace):
+            with self.tracer.span(f"ocr_{name}") as span:
+                result = self._extract_ocr_result_blocks(image, cancel_event, gate)
+                span["chars"] = len(result.text)
+                span["cancelled"] = cancel_event.is_set()
+        return result
+
+    def _ocr_regions_concurrent(self, regions, parent_cancel=None):
+        # regions: Liste von (Name, Bild) in Prioritaetsreihenfolge. Sobald die Region mit
+        # der hoechsten Prioritaet ein brauchbares Ergebnis hat und alle davor fertig und
+        # unbrauchbar sind, werden die uebrigen abgebrochen.
+        # Die erste Region hat den PSM-Pool fuer sich; die anderen erkennen ihre PSMs
+        # nacheinander und geben ihre Kacheln erst frei, wenn alle Regionen davor ohne
+        # brauchbares Ergebnis fertig sind (gates[idx]).
+        cancel_event = CancelToken(parent_cancel)
+        trace = self.tracer.current()
+        pool = self._get_region_pool()
+        gates = [None] + [threading.Event() for _ in regions[1:]]
+        futures = {
+            pool.submit(self._ocr_region_job, trace, name, image, cancel_event, gates[idx]): idx
+            for idx, (name, image) in enumerate(regions)
+        }
+        results = {}
+        chosen = None
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                results[futures[future]] = future.result()
+                for idx in range(len(regions)):
+                    if idx not in results:
+                        if gates[idx] is not None:
+                            gates[idx].set()
+                        break
+                    if len(results[idx].text) >= self.ocr_escalate_chars:
+                        chosen = idx
+                        break
+                if chosen is not None:
+                    break
+        finally:
+            cancel_event.set()
+            for future in futures:
+                future.cancel()
+
+        if chosen is None and results:
+            chosen = max(results, key=lambda idx: (len(results[idx].text), -idx))
+        if chosen is None:
+            return None, OcrResult()
+        return regions[chosen][0], results[chosen]
+
+    def close(self):
+        if self.tile_pool:
+            self.tile_pool.shutdown(wait=False, cancel_futures=True)
+        if self.target_pool:
+            self.target_pool.shutdown(wait=False, cancel_futures=True)
+        if self.translation_pool:
+            self.translation_pool.shutdown(wait=False, cancel_futures=True)
+        if self.region_pool:
+            self.region_pool.shutdown(wait=False, cancel_futures=True)
+        if self.ocr_pool:
+            self.ocr_pool.shutdown(wait=False, cancel_futures=True)
+        if self.ocr_engine:
+            self.ocr_engine.close()
+        self.translation_cache.close()
+
+
+class RegionWatcher:
+    # Live-Modus fuer ein festes Rechteck (Untertitel, Spiele): Aufnahme im festen Takt,
+    # Vergleich mit dem vorigen Bild pro Kachel, OCR nur fuer Baender mit geaenderten
+    # Kacheln und Uebersetzung nur fuer neuen Text. Erkannte Zeilen werden einzeln mit
+    # ihren Kachelzeilen gemerkt, damit spaeter nur betroffene Zeilen neu erkannt werden.
+    # on_update bekommt die Liste (Text, Uebersetzung) aller Zeilen in Lesereihenfolge.
+    def __init__(
+        self,
+        core,
+        bbox,
+        on_update,
+        interval=0.5,
+        tile_size=48,
+        change_threshold=0.01,
+        pixel_delta=40,
+        grab=None,
+    ):
+        self.core = core
+        self.bbox = bbox
+        self.on_update = on_update
+        self.interval = interval
+        self.tile_size = tile_size
+        self.change_threshold = change_threshold
+        self.pixel_delta = pixel_delta
+        self.grab = grab
+        self.previous = None
+        self.lines = {}
+        self.known = collections.OrderedDict()
+        self.stop_event = CancelToken()
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def _loop(self):
+        logging.info("Bereich wird beobachtet: %s, alle %.2fs", self.bbox, self.interval)
+        while not self.stop_event.is_set():
+            started = time.perf_counter()
+            try:
+                self.tick()
+            except Exception:
+                logging.exception("Beobachteter Bereich konnte nicht verarbeitet werden.")
+            self.stop_event.event.wait(max(0.0, self.interval - (time.perf_counter() - started)))
+        logging.info("Beobachtung beendet: %s", self.bbox)
+
+    def _changed_rows(self, gray):
+        # Anteil der Pixel pro Kachel, die sich um mehr als pixel_delta Grauwerte geaendert
+        # haben. Rueckgabe: Kachelzeilen mit mindestens einer geaenderten Kachel.
+        import numpy as np
+
+        t = self.tile_size
+        height, width = gray.shape
+        rows, cols = -(-height // t), -(-width // t)
+        if self.previous is None or self.previous.shape != gray.shape:
+            return list(range(rows)), rows
+        moved = np.zeros((rows * t, cols * t), dtype=np.float32)
+        moved[:height, :width] = np.abs(gray.astype(np.int16) - self.previous) > self.pixel_delta
+        tile_share = moved.reshape(rows, t, cols, t).mean(axis=(1, 3))
+        changed = (tile_share > self.change_threshold).any(axis=1)
+        return np.flatnonzero(changed).tolist(), rows
+
+    def _dirty_bands(self, changed_rows, total_rows):
+        # Benachbarte Kachelzeilen zu Baendern zusammenfassen (je eine Zeile Rand) und
+        # um ueberlappende bekannte Textzeilen erweitern, damit keine Zeile zerschnitten wird.
+        bands = []
+        for row in changed_rows:
+            start, end = max(0, row - 1), min(total_rows, row + 2)
+            if bands and start <= bands[-1][1]:
+                bands[-1][1] = max(bands[-1][1], end)
+            else:
+                bands.append([start, end])
+        merged = []
+        for start, end in bands:
+            grown = True
+            while grown:
+                grown = False
+                for known_start, known_end in [line["rows"] for line in self.lines.values()]:
+                    if known_start < end and known_end > start and not (
+                        start <= known_start and known_end <= end
+                    ):
+                        start, end = min(start, known_start), max(end, known_end)
+                        grown = True
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        return merged
+
+    def tick(self):
+        from PIL import ImageGrab
 
+        image = (self.grab or ImageGrab.grab)(self.bbox)
+        gray = gray_array(image)
+        changed_rows, total_rows = self._changed_rows(gray)
+        self.previous = gray
+        if not changed_rows:
+            return False
 
-class TranslationApp:
+        t = self.tile_size
+        with self.core.tracer.trace("watch", stage="watch_total", bbox=self.bbox):
+            self.core.tracer.annotate(changed_rows=len(changed_rows), total_rows=total_rows)
+            for start, end in self._dirty_bands(changed_rows, total_rows):
+                for key in [
+                    key
+                    for key, line in self.lines.items()
+                    if line["rows"][0] < end and line["rows"][1] > start
+                ]:
+                    del self.lines[key]
+                bottom = min(image.height, end * t)
+                crop = image.crop((0, start * t, image.width, bottom))
+                with self.core.tracer.span("ocr_watch") as span:
+                    result = self.core._extract_ocr_result(crop, cancel_event=self.stop_event)
+                    span["chars"] = len(result.text)
+                self._remember_lines(result, start * t, bottom)
+
+            for line in self.lines.values():
+                if "translation" in line:
+                    continue
+                translation = self.known.get(line["text"])
+                if translation is None:
+                    if self.stop_event.is_set():
+                        return False
+                    with self.core.tracer.span("translate"):
+                        translation = self.core._translate_text(line["text"], self.stop_event)
+                    self.known[line["text"]] = translation
+                    while len(self.known) > 256:
+                        self.known.popitem(last=False)
+                line["translation"] = translation
+
+        if not self.stop_event.is_set():
+            self.on_update(
+                [(line["text"], line["translation"]) for _key, line in sorted(self.lines.items())]
+            )
+        return True
+
+    def _remember_lines(self, result, offset, limit):
+        # Woerter pro Tesseract-Zeile sammeln; Schluessel (oben, links) ergibt die
+        # Lesereihenfolge, rows die belegten Kachelzeilen.
+        t = self.tile_size
+        grouped = collections.OrderedDict()
+        for word in result.words:
+            grouped.setdefault(word.line_key, []).append(word)
+        for words in grouped.values():
+            top = offset + min(word.box[1] for word in words)
+            bottom = min(limit, offset + max(word.box[1] + word.box[3] for word in words))
+            left = min(word.box[0] for word in words)
+            text = " ".join(word.text for word in words).strip()
+            if text:
+                rows = (top // t, max(top // t + 1, -(-bottom // t)))
+                self.lines[(top, left)] = {"rows": rows, "text": text}
+
+
+class TranslationApp(TranslationCore):
     def __init__(self):
+        import tkinter as tk
+
+        super().__init__()
         self._enable_dpi_awareness()
         self.hotkey_key = "d"
         self.hotkey_combo = f"<ctrl>+{self.hotkey_key}"
         self.window_hotkey_combo = f"<ctrl>+<shift>+{self.hotkey_key}"
-        self.ocr_languages = ["eng", "rus", "ukr", "ara"]
         self.listener = None
         self.hotkey = None
         self.window_hotkey = None
@@ -44,35 +2696,74 @@ class TranslationApp:
         self.hotkey_thread_id = None
         self.icon = None
         self.overlay = None
-        self.last_trigger_ts = 0.0
+        self.overlay_label = None
+        self.overlay_hide_job = None
+        # None: noch nicht versucht; False: Overlay vor jeder Aufnahme ausblenden.
+        self.overlay_excluded = None
+        self.scheduler = JobScheduler(max_workers=2)
+        # Bereitschaft der Engines (kalt, waermt auf, bereit); nach Standby oder laengerer
+        # Pause wird erneut aufgewaermt.
+        self.readiness = "cold"
+        self.readiness_detail = ""
+        self.warm_up_lock = threading.Lock()
+        self.warm_idle_seconds = 20 * 60
+        self.last_activity = time.monotonic()
+        self.idle_warmed = False
+        self.watchdog_stop = threading.Event()
+        # Bildschirmaufnahme: "auto" nimmt GDI mit geteiltem DIB-Puffer, sonst PIL.ImageGrab.
+        self.capture = create_capture_backend("auto")
+        # Live-Beobachtung eines Bereichs: Takt in Sekunden, Kachelgroesse in Pixeln und
+        # Anteil geaenderter Pixel pro Kachel, ab dem neu erkannt wird.
+        self.watcher = None
+        self.watch_bbox = None
+        self.watch_overlay = None
+        self.watch_label = None
+        self.watch_interval = 0.5
+        self.watch_tile_size = 48
+        self.watch_change_threshold = 0.01
         self.logo_path = self._find_logo_path()
         self.bg_path = self._find_background_path()
-        self.local_tessdata_dir = self._local_tessdata_dir()
-        self.available_ocr_languages = []
-        self.tesseract_path = None
-        self.tesseract_ready = False
         self.tk_logo = None
         self.bg_photo = None
         self.about_window = None
+        self.stats_window = None
+        self.stats_text = None
+        self.languages_provisioning = False
+        self.language_progress = {}
+        self.language_progress_lock = threading.Lock()
+        self.language_label_pending = False
+        self.bg_label = None
+        self.startup_marks = {}
 
         self.root = tk.Tk()
         self.root.title("Transilvania - Einstellungen")
-        self.root.geometry("460x620")
+        self.root.geometry("460x760")
         self.root.resizable(False, False)
         self.root.configure(bg="#0b0b0b")
         self.root.protocol("WM_DELETE_WINDOW", self.hide_to_background)
-        self._apply_window_icon()
+        self._mark_startup("tk_root")
 
+        # Hotkeys und Tray zuerst, alles andere danach bzw. im Warm-up-Thread.
+        self.start_listener()
+        self.start_tray_icon()
+        self._apply_window_icon()
         self._build_settings_ui()
+        self._mark_startup("settings_ui")
+        threading.Thread(target=self._warm_up, daemon=True).start()
+
         self.tesseract_ready = self.ensure_tesseract_available()
         if self.tesseract_ready:
-            self.ensure_ocr_languages()
-            self.requirements_label.config(text="Tesseract: OK", fg="#8ef08e")
+            # Sprachdateien im Hintergrund bereitstellen; Hotkeys fuer markierten Text
+            # funktionieren sofort, OCR sobald die erste Sprache vorliegt.
+            self.init_ocr_engine()
+            self.languages_provisioning = True
+            threading.Thread(target=self._provision_languages, daemon=True).start()
         else:
-            self.requirements_label.config(text="Tesseract: NICHT installiert", fg="#ff7a7a")
+            # Ohne Tesseract wenigstens den Uebersetzer aufwaermen.
+            self.start_engine_warm_up("start")
+        self._update_requirements_label()
+        threading.Thread(target=self._readiness_watchdog, daemon=True).start()
 
-        self.start_listener()
-        self.start_tray_icon()
         logging.info(
             "App gestartet. Hotkeys=STRG+%s | STRG+SHIFT+%s",
             self.hotkey_key.upper(),
@@ -133,118 +2824,137 @@ class TranslationApp:
                 return candidate
         return None
 
-    def _local_tessdata_dir(self):
-        base = Path(os.getenv("LOCALAPPDATA", str(Path.home())))
-        return base / "Transilvania" / "tessdata"
-
-    def _system_tessdata_dir(self):
-        if not self.tesseract_path:
-            return None
-        candidate = Path(self.tesseract_path).parent / "tessdata"
-        if candidate.exists():
-            return candidate
-        return None
-
-    def _resolve_tesseract_path(self):
-        candidates = [
-            Path(r"C:\Program Files\Tesseract-OCR\tesseract.exe"),
-            Path(r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe"),
-        ]
+    def _provision_languages(self):
+        try:
+            self.ensure_ocr_languages(progress=self._on_language_progress)
+        except Exception:
+            logging.exception("Bereitstellung der OCR-Sprachen fehlgeschlagen.")
+        finally:
+            self.languages_provisioning = False
+            self.root.after(0, self._update_requirements_label)
+        self.start_engine_warm_up("start")
 
-        for candidate in candidates:
-            if candidate.exists():
-                return str(candidate)
+    def start_engine_warm_up(self, reason):
+        if not self.warm_up_lock.acquire(blocking=False):
+            return
+        threading.Thread(target=self._warm_engines, args=(reason,), daemon=True).start()
 
-        path_hit = shutil.which("tesseract")
-        if path_hit:
-            return path_hit
+    def _warm_engines(self, reason):
+        self.readiness = "warming"
+        self.root.after(0, self._update_requirements_label)
+        try:
+            timings = self.warm_up()
+            self.readiness = "ready"
+            self.readiness_detail = ", ".join(f"{k[:-3]} {v:.0f}ms" for k, v in timings.items())
+            logging.info("Warm-up (%s) fertig: %s", reason, self.readiness_detail)
+            if "engines" not in self.startup_marks:
+                self._mark_startup("engines")
+        except Exception:
+            logging.exception("Warm-up (%s) fehlgeschlagen.", reason)
+            self.readiness = "failed"
+        finally:
+            self.warm_up_lock.release()
+            self.root.after(0, self._update_requirements_label)
 
-        return None
+    def _readiness_watchdog(self):
+        # Steht der Thread deutlich laenger als sein Takt, war der Rechner im Standby; dann
+        # sind Modelle ausgelagert und Verbindungen weg. Ebenso einmal nach langer Pause.
+        wall = time.time()
+        while not self.watchdog_stop.wait(30):
+            if self.ocr_engine:
+                self.ocr_engine.trim_idle()
+            now = time.time()
+            slept = now - wall > 90
+            wall = now
+            idle = time.monotonic() - self.last_activity > self.warm_idle_seconds
+            if slept:
+                logging.info("Standby erkannt, waerme erneut auf.")
+                self.readiness = "cold"
+                self.start_engine_warm_up("standby")
+            elif idle and not self.idle_warmed:
+                self.idle_warmed = True
+                self.start_engine_warm_up("idle")
 
-    def ensure_tesseract_available(self):
-        self.tesseract_path = self._resolve_tesseract_path()
-        if self.tesseract_path:
-            pytesseract.pytesseract.tesseract_cmd = self.tesseract_path
-            logging.info("Tesseract gefunden: %s", self.tesseract_path)
-            return True
+    def _on_language_progress(self, lang, done, total, state):
+        # Kommt aus den Download-Threads; die Anzeige wird gesammelt im Tk-Thread gesetzt.
+        with self.language_progress_lock:
+            self.language_progress[lang] = (done, total, state)
+            if self.language_label_pending:
+                return
+            self.language_label_pending = True
+        self.root.after(250, self._update_requirements_label)
 
-        logging.warning("Tesseract nicht gefunden.")
-        open_link = messagebox.askyesno(
-            "Tesseract fehlt",
-            "Tesseract-OCR ist nicht installiert.\n\n"
-            "Ohne Tesseract funktioniert OCR auf nicht-markiertem Text nicht.\n"
-            "Markierter Text kann weiterhin uebersetzt werden.\n\n"
-            "Installationsseite jetzt oeffnen?",
-        )
-        if open_link:
-            webbrowser.open(TESSERACT_URL)
-        return False
+    def _update_requirements_label(self):
+        with self.language_progress_lock:
+            self.language_label_pending = False
+            progress = dict(self.language_progress)
 
-    def ensure_ocr_languages(self):
-        self.local_tessdata_dir.mkdir(parents=True, exist_ok=True)
-        missing = []
-        system_tess = self._system_tessdata_dir()
+        readiness = READINESS_LABELS[self.readiness]
+        if self.readiness == "ready" and self.readiness_detail:
+            readiness = f"{readiness} ({self.readiness_detail})"
+        if self.icon:
+            self.icon.title = f"Transilvania OCR - {readiness}"
 
-        for lang in self.ocr_languages:
-            local_file = self.local_tessdata_dir / f"{lang}.traineddata"
-            if local_file.exists():
-                continue
+        if not self.tesseract_ready:
+            self.requirements_label.config(
+                text=f"Tesseract: NICHT installiert | Engine: {readiness}", fg="#ff7a7a"
+            )
+            return
 
-            if system_tess:
-                system_file = system_tess / f"{lang}.traineddata"
-                if system_file.exists():
-                    shutil.copy2(system_file, local_file)
-                    logging.info("Sprache aus System uebernommen: %s", lang)
+        if self.languages_provisioning:
+            loading = []
+            for lang, (done, total, state) in progress.items():
+                if state != "download":
                     continue
+                if total:
+                    loading.append(f"{lang} {min(100, done * 100 // total)}%")
+                else:
+                    loading.append(f"{lang} {done // 1024} KB")
+            text = "Tesseract: OK | Sprachen: " + (
+                "lade " + ", ".join(loading) if loading else "pruefe..."
+            )
+            self.requirements_label.config(text=text, fg="#f0d98e")
+            return
 
-            missing.append(lang)
-
-        for lang in missing:
-            self._download_lang(lang)
-
-        available = []
-        unresolved = []
-        for lang in self.ocr_languages:
-            traineddata = self.local_tessdata_dir / f"{lang}.traineddata"
-            if traineddata.exists():
-                available.append(lang)
-            else:
-                unresolved.append(lang)
-
-        self.available_ocr_languages = available
-        if unresolved:
-            logging.warning(
-                "OCR Sprachdateien fehlen weiterhin: %s",
-                "+".join(unresolved),
+        missing = [
+            lang for lang in self.ocr_languages if lang not in self.available_ocr_languages
+        ]
+        if missing:
+            self.requirements_label.config(
+                text="Tesseract: OK | Sprachen fehlen: " + "+".join(missing),
+                fg="#ff7a7a",
+            )
+        else:
+            self.requirements_label.config(
+                text=f"Tesseract: OK | Engine: {readiness}",
+                fg="#8ef08e" if self.readiness == "ready" else "#f0d98e",
             )
-        if not self.available_ocr_languages:
-            logging.error("Keine OCR Sprachdateien verfuegbar.")
 
-        logging.info(
-            "OCR Sprachordner: %s | Verfuegbar: %s",
-            self.local_tessdata_dir,
-            "+".join(self.available_ocr_languages) or "keine",
-        )
+    def ensure_tesseract_available(self):
+        if self.setup_tesseract():
+            return True
+        # Hinweis erst aus der laufenden Hauptschleife: ein modaler Dialog hier im
+        # Konstruktor blockiert sie, und root.after aus Tray-/Warm-up-Threads schlaegt
+        # dann fehl ("main thread is not in main loop").
+        self.root.after(0, self._show_tesseract_missing)
+        return False
+
+    def _show_tesseract_missing(self):
+        from tkinter import messagebox
 
-    def _download_lang(self, lang):
-        url = (
-            "https://raw.githubusercontent.com/tesseract-ocr/tessdata_fast/main/"
-            f"{lang}.traineddata"
+        open_link = messagebox.askyesno(
+            "Tesseract fehlt",
+            "Tesseract-OCR ist nicht installiert.\n\n"
+            "Ohne Tesseract funktioniert OCR auf nicht-markiertem Text nicht.\n"
+            "Markierter Text kann weiterhin uebersetzt werden.\n\n"
+            "Installationsseite jetzt oeffnen?",
         )
-        target = self.local_tessdata_dir / f"{lang}.traineddata"
-        try:
-            logging.info("Lade Sprache herunter: %s", lang)
-            with requests.get(url, timeout=90, stream=True) as resp:
-                resp.raise_for_status()
-                with open(target, "wb") as fh:
-                    for chunk in resp.iter_content(chunk_size=1024 * 256):
-                        if chunk:
-                            fh.write(chunk)
-            logging.info("Sprache installiert: %s", lang)
-        except Exception:
-            logging.exception("Download fehlgeschlagen fuer Sprache: %s", lang)
+        if open_link:
+            webbrowser.open(TESSERACT_URL)
 
     def _apply_window_icon(self):
+        import tkinter as tk
+
         if not self.logo_path:
             logging.info("Kein Logo gefunden, nutze Standard-Icon.")
             return
@@ -259,19 +2969,19 @@ class TranslationApp:
             logging.exception("Window-Icon konnte nicht geladen werden.")
 
     def _build_settings_ui(self):
+        import tkinter as tk
+
         root_frame = tk.Frame(self.root, bg="#0b0b0b")
         root_frame.pack(fill="both", expand=True)
 
         if self.bg_path:
-            try:
-                bg_img = Image.open(self.bg_path).convert("RGB")
-                bg_img = ImageOps.contain(bg_img, (436, 320))
-                self.bg_photo = ImageTk.PhotoImage(bg_img)
-                bg_label = tk.Label(root_frame, image=self.bg_photo, bd=0, bg="#0b0b0b")
-                bg_label.pack(padx=12, pady=(12, 8))
-                logging.info("Hintergrundbild geladen: %s", self.bg_path)
-            except Exception:
-                logging.exception("Hintergrundbild konnte nicht geladen werden.")
+            # Skaliertes Bild liegt als PNG im Cache und wird direkt von Tk geladen; fehlt
+            # es, erzeugt der Warm-up-Thread es mit PIL und setzt es nachtraeglich.
+            self.bg_label = tk.Label(root_frame, bd=0, bg="#0b0b0b")
+            self.bg_label.pack(padx=12, pady=(12, 8))
+            cached = self._background_cache_path()
+            if cached.exists():
+                self._show_background(cached)
 
         panel = tk.Frame(root_frame, padx=14, pady=12, bg="#000000")
         panel.pack(fill="x", padx=12, pady=(0, 12))
@@ -314,6 +3024,45 @@ class TranslationApp:
         )
         self.requirements_label.pack(fill="x", pady=(2, 0))
 
+        policy_row = tk.Frame(panel, bg="#000000")
+        policy_row.pack(fill="x", pady=(6, 0))
+        tk.Label(policy_row, text="Uebersetzung:", fg="white", bg="#000000").pack(side="left")
+        self.policy_var = tk.StringVar(value=TRANSLATION_POLICY_LABELS[self.translation_policy])
+        policy_menu = tk.OptionMenu(
+            policy_row,
+            self.policy_var,
+            *TRANSLATION_POLICY_LABELS.values(),
+            command=self._on_policy_change,
+        )
+        policy_menu.config(highlightthickness=0)
+        policy_menu.pack(side="left", fill="x", expand=True, padx=(6, 0))
+
+        targets_row = tk.Frame(panel, bg="#000000")
+        targets_row.pack(fill="x", pady=(6, 0))
+        tk.Label(targets_row, text="Zielsprachen:", fg="white", bg="#000000").pack(side="left")
+        self.targets_var = tk.StringVar(value="+".join(self.translation_targets))
+        targets_entry = tk.Entry(targets_row, textvariable=self.targets_var)
+        targets_entry.pack(side="left", fill="x", expand=True, padx=(6, 0))
+        targets_entry.bind("<Return>", self._on_targets_change)
+        targets_entry.bind("<FocusOut>", self._on_targets_change)
+
+        self.cache_label = tk.Label(
+            panel,
+            text=self.translation_cache.stats_text(),
+            font=("Arial", 9),
+            fg="#d0d0d0",
+            bg="#000000",
+            anchor="w",
+        )
+        self.cache_label.pack(fill="x", pady=(2, 0))
+
+        tk.Button(panel, text="Latenz-Statistik", command=self.open_stats_window).pack(
+            fill="x", pady=(8, 0)
+        )
+
+        self.watch_button = tk.Button(panel, text="Bereich beobachten", command=self._toggle_watch)
+        self.watch_button.pack(fill="x", pady=(6, 0))
+
         tk.Button(panel, text="Im Hintergrund laufen", command=self.hide_to_background).pack(
             fill="x", pady=(10, 0)
         )
@@ -335,50 +3084,87 @@ class TranslationApp:
             width=20,
         ).pack(anchor="center")
 
-    def _preprocess_for_ocr(self, image):
-        gray = ImageOps.grayscale(image)
-        scale = 2
-        resampling = getattr(Image, "Resampling", Image)
-        enlarged = gray.resize((gray.width * scale, gray.height * scale), resampling.LANCZOS)
-        return ImageOps.autocontrast(enlarged)
+    def _on_targets_change(self, _event=None):
+        targets = parse_targets(self.targets_var.get())
+        if targets and targets != self.translation_targets:
+            self.translation_targets = targets
+            logging.info("Zielsprachen: %s", "+".join(targets))
+        self.targets_var.set("+".join(self.translation_targets))
 
-    def _extract_text_from_image(self, image):
-        processed = self._preprocess_for_ocr(image)
-        return self._extract_text_multi_config(processed)
+    def _on_policy_change(self, label):
+        from tkinter import messagebox
 
-    def _extract_text_multi_config(self, processed_image):
-        configs = (
-            "--oem 1 --psm 6",
-            "--oem 1 --psm 11",
-            "--oem 1 --psm 3",
-        )
-        best_text = ""
-        lang = "+".join(self.available_ocr_languages)
-        tessdata_dir = str(self.local_tessdata_dir)
-        for cfg in configs:
+        for policy, policy_label in TRANSLATION_POLICY_LABELS.items():
+            if policy_label == label:
+                self.translation_policy = policy
+                logging.info("Uebersetzungs-Richtlinie: %s", policy)
+                break
+        dictionary = self.translation_backends["dictionary"]
+        if "dictionary" in TRANSLATION_POLICIES[self.translation_policy] and not (
+            dictionary.available
+        ):
+            messagebox.showwarning(
+                "Offline-Uebersetzung",
+                "Keine Woerterbuecher gefunden. Lege <quelle>-<ziel>.tsv Dateien ab in:\n"
+                f"{dictionary.dictionary_dir}",
+                parent=self.root,
+            )
+
+    def _background_cache_path(self):
+        stat = self.bg_path.stat()
+        width, height = BACKGROUND_SIZE
+        name = f"{self.bg_path.stem}_{width}x{height}_{stat.st_size}_{stat.st_mtime_ns}.png"
+        return self.local_tessdata_dir.parent / "cache" / name
+
+    def _build_background_cache(self):
+        from PIL import Image, ImageOps
+
+        target = self._background_cache_path()
+        if target.exists():
+            return target
+        target.parent.mkdir(parents=True, exist_ok=True)
+        for old in target.parent.glob(f"{self.bg_path.stem}_*.png"):
+            old.unlink()
+        with Image.open(self.bg_path) as bg_img:
+            bg_img = ImageOps.contain(bg_img.convert("RGB"), BACKGROUND_SIZE)
+        part_file = target.with_name(target.name + ".part")
+        bg_img.save(part_file, format="PNG")
+        os.replace(part_file, target)
+        logging.info("Hintergrundbild skaliert und gecacht: %s", target)
+        return target
+
+    def _show_background(self, path):
+        import tkinter as tk
+
+        try:
+            self.bg_photo = tk.PhotoImage(file=str(path))
+            self.bg_label.config(image=self.bg_photo)
+            logging.info("Hintergrundbild geladen: %s", path)
+        except Exception:
+            logging.exception("Hintergrundbild konnte nicht geladen werden.")
+
+    def _mark_startup(self, name):
+        # Millisekunden seit Modulstart; wird geloggt und in der Latenz-Statistik gezeigt.
+        elapsed = _elapsed_ms(STARTUP_STARTED)
+        with self.tracer.lock:
+            self.startup_marks[name] = elapsed
+        logging.info("Startzeit %s: %sms", name, elapsed)
+
+    def _warm_up(self):
+        # Schwere Module und Ressourcen im Hintergrund laden, bevor der erste OCR-Hotkey
+        # sie braucht. Parallel laufende Hotkeys importieren bei Bedarf selbst.
+        for name in WARMUP_MODULES:
             try:
-                text = pytesseract.image_to_string(
-                    processed_image,
-                    lang=lang,
-                    config=f"{cfg} --tessdata-dir {tessdata_dir}",
-                )
-                text = re.sub(r"\s+", " ", (text or "")).strip()
-                if len(text) > len(best_text):
-                    best_text = text
+                importlib.import_module(name)
             except Exception:
-                logging.exception("OCR-Konfiguration fehlgeschlagen: %s", cfg)
-                try:
-                    text = pytesseract.image_to_string(
-                        processed_image,
-                        lang=lang,
-                        config=cfg,
-                    )
-                    text = re.sub(r"\s+", " ", (text or "")).strip()
-                    if len(text) > len(best_text):
-                        best_text = text
-                except Exception:
-                    pass
-        return best_text
+                logging.exception("Warm-up: Modul %s konnte nicht geladen werden.", name)
+        if self.bg_path and self.bg_photo is None:
+            try:
+                cached = self._build_background_cache()
+                self.root.after(0, lambda: self._show_background(cached))
+            except Exception:
+                logging.exception("Hintergrundbild konnte nicht gecacht werden.")
+        self._mark_startup("warmup")
 
     def _read_window_text(self, hwnd):
         user32 = ctypes.windll.user32
@@ -450,13 +3236,61 @@ class TranslationApp:
             logging.exception("Fensterrechteck konnte nicht ermittelt werden.")
             return None
 
-    def _fallback_fullscreen_ocr(self):
+    def _grab(self, bbox):
+        # Eigenes Overlay nie mit aufnehmen: ist es nicht per Display-Affinity
+        # ausgenommen, wird es vorher im Tk-Thread ausgeblendet.
+        if self.overlay is not None and not self.overlay_excluded:
+            hidden = threading.Event()
+
+            def _withdraw():
+                self._hide_overlay()
+                self.root.update_idletasks()
+                hidden.set()
+
+            self.root.after(0, _withdraw)
+            if hidden.wait(0.5):
+                # Ein Frame, bis der Compositor das Fenster wirklich entfernt hat.
+                time.sleep(0.02)
+        return self.capture.grab(bbox)
+
+    def _capture_regions(self, x, y, force_window):
+        # Alle Kandidaten sofort aufnehmen, erkannt wird danach parallel. "Fullscreen" ist
+        # der Monitor unter der Maus, nicht der ganze virtuelle Bildschirm.
+        regions = []
+        if not force_window:
+            with self.tracer.span("capture_mouse"):
+                regions.append(("mouse", self._grab((x - 170, y - 55, x + 170, y + 55))))
+        window_bbox = self._get_window_bbox_at_point(x, y)
+        if window_bbox:
+            with self.tracer.span("capture_window"):
+                regions.append(("window", self._grab(window_bbox)))
+        with self.tracer.span("capture_fullscreen"):
+            regions.append(("fullscreen", self._grab(monitor_bbox_at(x, y))))
+        return regions
+
+    def _concurrent_region_ocr(self, regions, x, y, cancel_event=None):
+        name, result = self._ocr_regions_concurrent(regions, cancel_event)
+        logging.info(
+            "OCR parallel bei (%s,%s), Region=%s, OCR=%r, Konfidenz=%.1f",
+            x,
+            y,
+            name,
+            result.text,
+            result.confidence,
+        )
+        return result
+
+    def _fallback_fullscreen_ocr(self, x, y, cancel_event=None):
         try:
-            screenshot = ImageGrab.grab()
-            return self._extract_text_from_image(screenshot)
+            with self.tracer.span("capture_fullscreen"):
+                screenshot = self._grab(monitor_bbox_at(x, y))
+            with self.tracer.span("ocr_fullscreen") as span:
+                result = self._extract_ocr_result_blocks(screenshot, cancel_event)
+                span["chars"] = len(result.text)
+            return result
         except Exception:
             logging.exception("Fullscreen-OCR fehlgeschlagen.")
-            return ""
+            return OcrResult()
 
     def _on_hotkey_input_change(self, event=None):
         raw = (self.hotkey_var.get() or "").strip().lower()
@@ -543,145 +3377,387 @@ class TranslationApp:
             logging.exception("Markierter Text konnte ohne Zwischenablage nicht gelesen werden.")
             return ""
 
-    def perform_translate(self, prefer_clipboard, force_window, use_ocr_fallback):
+    def perform_translate(
+        self,
+        prefer_clipboard,
+        force_window,
+        use_ocr_fallback,
+        job_id=None,
+        cancel_event=None,
+    ):
         try:
+            import pyautogui
+
             x, y = pyautogui.position()
             text = ""
 
             if prefer_clipboard:
-                text = self._get_selected_text_from_focus_control()
+                with self.tracer.span("selection") as span:
+                    text = self._get_selected_text_from_focus_control()
+                    span["chars"] = len(text)
                 if text:
                     logging.info("Text aus Markierung gelesen: %r", text)
 
             if not text:
-                window_text = self._extract_text_from_foreground_window()
+                with self.tracer.span("window_text") as span:
+                    window_text = self._extract_text_from_foreground_window()
+                    span["chars"] = len(window_text)
                 if window_text:
                     text = window_text
                     logging.info("Text aus aktivem Fenster gelesen: %r", text)
 
             if not text and use_ocr_fallback:
                 if not self.tesseract_ready:
-                    self.root.after(
-                        0,
-                        lambda: self.show_overlay(
-                            "Tesseract fehlt. Installiere es, um OCR ohne Markierung zu nutzen.",
-                            x,
-                            max(10, y - 50),
-                        ),
+                    self._post_overlay(
+                        job_id,
+                        "Tesseract fehlt. Installiere es, um OCR ohne Markierung zu nutzen.",
+                        x,
+                        max(10, y - 50),
+                    )
+                    return
+
+                if not self.available_ocr_languages and self.languages_provisioning:
+                    self._post_overlay(
+                        job_id,
+                        "OCR-Sprachdateien werden noch geladen...",
+                        x,
+                        max(10, y - 50),
                     )
                     return
 
                 if not self.available_ocr_languages:
-                    self.root.after(
-                        0,
-                        lambda: self.show_overlay(
+                    self._post_overlay(
+                        job_id,
                         "Keine OCR-Sprachdateien verfuegbar. Pruefe Internet/Tesseract-Setup.",
-                            x,
-                            max(10, y - 50),
-                        ),
+                        x,
+                        max(10, y - 50),
                     )
                     return
 
-                if not force_window:
-                    bbox = (x - 170, y - 55, x + 170, y + 55)
-                    screenshot = ImageGrab.grab(bbox)
-                    text = self._extract_text_from_image(screenshot)
-                    logging.info("OCR Mausbereich bei (%s,%s), OCR=%r", x, y, text)
-
-                if force_window or len(text) < 8:
-                    window_bbox = self._get_window_bbox_at_point(x, y)
-                    if window_bbox:
-                        window_shot = ImageGrab.grab(window_bbox)
-                        window_text = self._extract_text_from_image(window_shot)
-                        if len(window_text) > len(text):
-                            text = window_text
+                # Fortschritt erst nach der ersten Aufnahme zeigen, siehe _grab.
+                if self.ocr_concurrent_regions:
+                    regions = self._capture_regions(x, y, force_window)
+                    self._post_overlay(job_id, "Erkenne Text...", x, max(10, y - 50), "progress")
+                    text = self._concurrent_region_ocr(regions, x, y, cancel_event).text
+                else:
+                    ocr_result = OcrResult()
+                    if not force_window:
+                        bbox = (x - 170, y - 55, x + 170, y + 55)
+                        with self.tracer.span("capture_mouse"):
+                            screenshot = self._grab(bbox)
+                    self._post_overlay(job_id, "Erkenne Text...", x, max(10, y - 50), "progress")
+                    if not force_window:
+                        with self.tracer.span("ocr_mouse") as span:
+                            ocr_result = self._extract_ocr_result(screenshot, cancel_event)
+                            span["chars"] = len(ocr_result.text)
+                        text = ocr_result.text
                         logging.info(
-                            "OCR Fensterbereich bei (%s,%s), bbox=%s, OCR=%r",
+                            "OCR Mausbereich bei (%s,%s), OCR=%r, Konfidenz=%.1f",
                             x,
                             y,
-                            window_bbox,
                             text,
+                            ocr_result.confidence,
+                        )
+
+                    too_short = len(text) < self.ocr_escalate_chars
+                    if (force_window or too_short) and not self._job_stale(cancel_event):
+                        window_bbox = self._get_window_bbox_at_point(x, y)
+                        if window_bbox:
+                            with self.tracer.span("capture_window"):
+                                window_shot = self._grab(window_bbox)
+                            with self.tracer.span("ocr_window") as span:
+                                window_result = self._extract_ocr_result_blocks(
+                                    window_shot, cancel_event
+                                )
+                                span["chars"] = len(window_result.text)
+                            if len(window_result.text) > len(text):
+                                ocr_result = window_result
+                                text = window_result.text
+                            logging.info(
+                                "OCR Fensterbereich bei (%s,%s), bbox=%s, OCR=%r, Konfidenz=%.1f",
+                                x,
+                                y,
+                                window_bbox,
+                                text,
+                                ocr_result.confidence,
+                            )
+                        elif force_window:
+                            logging.info("Kein Fenster unter Maus gefunden, nutze Fullscreen-OCR.")
+
+                    too_short = len(text) < self.ocr_escalate_chars
+                    if too_short and not self._job_stale(cancel_event):
+                        fullscreen_result = self._fallback_fullscreen_ocr(x, y, cancel_event)
+                        if len(fullscreen_result.text) > len(text):
+                            ocr_result = fullscreen_result
+                            text = fullscreen_result.text
+                        logging.info(
+                            "OCR Fullscreen-Fallback, OCR=%r, Konfidenz=%.1f",
+                            text,
+                            ocr_result.confidence,
                         )
-                    elif force_window:
-                        logging.info("Kein Fenster unter Maus gefunden, nutze Fullscreen-OCR.")
 
-                if len(text) < 8:
-                    fullscreen_text = self._fallback_fullscreen_ocr()
-                    if len(fullscreen_text) > len(text):
-                        text = fullscreen_text
-                    logging.info("OCR Fullscreen-Fallback, OCR=%r", text)
+            if self._job_stale(cancel_event):
+                raise JobCancelled()
 
             if not text or len(text) < 2:
                 msg = "Kein Text erkannt (Markierung/Fenstertext)."
                 if use_ocr_fallback:
                     msg = "Kein Text erkannt (weder Markierung noch OCR)."
-                self.root.after(
-                    0,
-                    lambda: self.show_overlay(
-                        msg,
-                        x,
-                        max(10, y - 50),
-                    ),
+                self._post_overlay(job_id, msg, x, max(10, y - 50))
+                return
+
+            verdict = self._check_text(text)
+            if verdict == "noise":
+                self._post_overlay(
+                    job_id, "Kein uebersetzbarer Text erkannt.", x, max(10, y - 50)
                 )
                 return
 
-            translation = GoogleTranslator(source="auto", target="de").translate(text)
-            logging.info("Uebersetzung=%r", translation)
-            self.root.after(0, lambda: self.show_overlay(translation, x, max(10, y - 50)))
+            # Quelltext sofort zeigen, die Uebersetzung ersetzt ihn, sobald sie da ist.
+            preview = text
+            if len(preview) > OVERLAY_SOURCE_PREVIEW_CHARS:
+                preview = preview[:OVERLAY_SOURCE_PREVIEW_CHARS].rstrip() + " ..."
+            self._post_overlay(job_id, preview, x, max(10, y - 50), "source")
+            with self.tracer.span("translate") as span:
+                translations = self.translate_targets(text, cancel_event)
+                span["targets"] = len(translations)
+            logging.info("Uebersetzung=%r", translations)
+            labelled = len(self.translation_targets) > 1
+            self._post_overlay(
+                job_id, format_translations(translations, labelled), x, max(10, y - 50)
+            )
+        except JobCancelled:
+            self.tracer.annotate(cancelled=True)
+            logging.info("Auftrag %s abgebrochen, neuerer Hotkey-Druck.", job_id)
         except Exception as exc:
             logging.exception("Fehler bei Translation")
-            self.root.after(0, lambda: self.show_overlay(f"Fehler: {exc}", 30, 30))
+            self._post_overlay(job_id, f"Fehler: {exc}", 30, 30)
 
-    def show_overlay(self, text, x, y):
-        if self.overlay and self.overlay.winfo_exists():
-            self.overlay.destroy()
+    def _job_stale(self, cancel_event):
+        return cancel_event is not None and cancel_event.is_set()
+
+    def _post_overlay(self, job_id, text, x, y, state="final"):
+        # Nur das Ergebnis des neuesten Auftrags anzeigen; geprueft erst im Tk-Thread,
+        # damit auch ein kurz vorher eingegangener Druck noch beruecksichtigt wird.
+        def _show():
+            if job_id is not None and not self.scheduler.is_current(job_id):
+                logging.info("Ergebnis von Auftrag %s veraltet, nicht angezeigt.", job_id)
+                return
+            self.show_overlay(text, x, y, state)
+
+        self.root.after(0, _show)
+
+    def _translate_text(self, text, cancel_event=None, target=None):
+        translation = super()._translate_text(text, cancel_event, target)
+        self.root.after(0, self._update_cache_label)
+        return translation
+
+    def _update_cache_label(self):
+        self.cache_label.config(text=self.translation_cache.stats_text())
+
+    def show_overlay(self, text, x, y, state="final"):
+        # Ein Overlay-Fenster fuer alle Ergebnisse: wird nur verschoben, neu beschriftet und
+        # ein-/ausgeblendet. Zwischenstaende ("progress", "source") bleiben stehen, bis das
+        # Endergebnis kommt; erst das blendet sich nach 4,5 s aus.
+        import tkinter as tk
+
+        if not (self.overlay and self.overlay.winfo_exists()):
+            self.overlay = tk.Toplevel(self.root)
+            self.overlay.overrideredirect(True)
+            self.overlay.attributes("-topmost", True)
+            self.overlay.attributes("-alpha", 0.92)
+            self.overlay.configure(bg="black")
+            self.overlay_label = tk.Label(
+                self.overlay,
+                bg="black",
+                padx=10,
+                pady=6,
+                justify="left",
+                wraplength=500,
+            )
+            self.overlay_label.pack()
+            self.overlay_hide_job = None
 
-        self.overlay = tk.Toplevel(self.root)
-        self.overlay.overrideredirect(True)
-        self.overlay.attributes("-topmost", True)
-        self.overlay.attributes("-alpha", 0.92)
-        self.overlay.configure(bg="black")
+        if self.overlay_hide_job is not None:
+            self.overlay.after_cancel(self.overlay_hide_job)
+            self.overlay_hide_job = None
+
+        fg, font = OVERLAY_STYLES[state]
+        self.overlay_label.config(text=text, fg=fg, font=font)
         self.overlay.geometry(f"+{x}+{y}")
+        self.overlay.deiconify()
+        self.overlay.lift()
+        if self.overlay_excluded is None:
+            self.overlay.update_idletasks()
+            self.overlay_excluded = exclude_from_capture(self.overlay.winfo_id())
+            logging.info("Overlay von Aufnahmen ausgenommen: %s", self.overlay_excluded)
+        if state == "final":
+            self.overlay_hide_job = self.overlay.after(4500, self._hide_overlay)
 
-        label = tk.Label(
-            self.overlay,
-            text=text,
-            fg="white",
-            bg="black",
-            font=("Segoe UI", 11, "bold"),
-            padx=10,
-            pady=6,
-            justify="left",
-            wraplength=500,
+    def _hide_overlay(self):
+        if self.overlay_hide_job is not None:
+            self.overlay.after_cancel(self.overlay_hide_job)
+            self.overlay_hide_job = None
+        if self.overlay and self.overlay.winfo_exists():
+            self.overlay.withdraw()
+
+    def toggle_watch(self, icon=None, item=None):
+        # Auch aus dem Tray-Thread aufrufbar; die Tk-Arbeit laeuft im Tk-Thread.
+        self.root.after(0, self._toggle_watch)
+
+    def _toggle_watch(self):
+        if self.watcher is not None:
+            self.stop_watch()
+            return
+        if not (self.tesseract_ready and self.available_ocr_languages):
+            self.show_overlay("OCR ist noch nicht bereit.", 30, 30)
+            return
+        self._pick_region(self.start_watch)
+
+    def _pick_region(self, on_selected):
+        # Halbtransparente Flaeche ueber dem Bildschirm; Rechteck mit der Maus aufziehen,
+        # Esc bricht ab.
+        import tkinter as tk
+
+        picker = tk.Toplevel(self.root)
+        picker.overrideredirect(True)
+        picker.attributes("-topmost", True)
+        picker.attributes("-alpha", 0.3)
+        picker.geometry(f"{self.root.winfo_screenwidth()}x{self.root.winfo_screenheight()}+0+0")
+        canvas = tk.Canvas(picker, bg="black", highlightthickness=0, cursor="crosshair")
+        canvas.pack(fill="both", expand=True)
+        state = {}
+
+        def _press(event):
+            state["start"] = (event.x_root, event.y_root, event.x, event.y)
+            state["rect"] = canvas.create_rectangle(
+                event.x, event.y, event.x, event.y, outline="#8ef08e", width=2
+            )
+
+        def _drag(event):
+            if "rect" in state:
+                _x_root, _y_root, x0, y0 = state["start"]
+                canvas.coords(state["rect"], x0, y0, event.x, event.y)
+
+        def _release(event):
+            picker.destroy()
+            if "start" not in state:
+                return
+            x0, y0 = state["start"][:2]
+            bbox = (
+                min(x0, event.x_root),
+                min(y0, event.y_root),
+                max(x0, event.x_root),
+                max(y0, event.y_root),
+            )
+            if bbox[2] - bbox[0] < 16 or bbox[3] - bbox[1] < 8:
+                logging.info("Auswahl zu klein, Beobachtung nicht gestartet.")
+                return
+            on_selected(bbox)
+
+        canvas.bind("<ButtonPress-1>", _press)
+        canvas.bind("<B1-Motion>", _drag)
+        canvas.bind("<ButtonRelease-1>", _release)
+        picker.bind("<Escape>", lambda _event: picker.destroy())
+        picker.focus_force()
+
+    def start_watch(self, bbox):
+        self.watch_bbox = bbox
+        self.watcher = RegionWatcher(
+            self,
+            bbox,
+            lambda lines: self.root.after(0, lambda: self._update_watch_overlay(lines)),
+            interval=self.watch_interval,
+            tile_size=self.watch_tile_size,
+            change_threshold=self.watch_change_threshold,
+            grab=self.capture.grab,
         )
-        label.pack()
-        self.overlay.after(4500, self.overlay.destroy)
+        self.watcher.start()
+        self.watch_button.config(text="Beobachtung beenden")
 
-    def on_hotkey_pressed(self):
-        now = time.monotonic()
-        if now - self.last_trigger_ts < 0.7:
+    def stop_watch(self):
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher = None
+        if self.watch_overlay and self.watch_overlay.winfo_exists():
+            self.watch_overlay.destroy()
+        self.watch_overlay = None
+        self.watch_button.config(text="Bereich beobachten")
+
+    def _update_watch_overlay(self, lines):
+        # Ein Fenster fuer die ganze Beobachtung, nur der Text wird ersetzt.
+        import tkinter as tk
+
+        if self.watcher is None:
             return
-        self.last_trigger_ts = now
+        text = "\n".join(translation for _text, translation in lines if translation)
+        if not (self.watch_overlay and self.watch_overlay.winfo_exists()):
+            self.watch_overlay = tk.Toplevel(self.root)
+            self.watch_overlay.overrideredirect(True)
+            self.watch_overlay.attributes("-topmost", True)
+            self.watch_overlay.attributes("-alpha", 0.92)
+            self.watch_overlay.configure(bg="black")
+            self.watch_label = tk.Label(
+                self.watch_overlay,
+                fg="white",
+                bg="black",
+                font=("Segoe UI", 11, "bold"),
+                padx=10,
+                pady=6,
+                justify="left",
+            )
+            self.watch_label.pack()
+            self.watch_overlay.update_idletasks()
+            # Sonst erkennt der Watcher seine eigene Uebersetzung wieder.
+            exclude_from_capture(self.watch_overlay.winfo_id())
+        left, top, right, bottom = self.watch_bbox
+        self.watch_label.config(text=text or "...", wraplength=max(300, right - left))
+        self.watch_overlay.update_idletasks()
+        # Unter dem Bereich, sonst darueber, sonst rechts daneben; nie im Bereich selbst.
+        width = self.watch_overlay.winfo_reqwidth()
+        height = self.watch_overlay.winfo_reqheight()
+        x, y = left, bottom + 8
+        if y + height > self.root.winfo_screenheight():
+            y = top - height - 8
+        if y < 0:
+            x, y = right + 8, max(0, top)
+            if x + width > self.root.winfo_screenwidth():
+                x = max(0, left - width - 8)
+        self.watch_overlay.geometry(f"+{x}+{y}")
+
+    def _traced_translate(
+        self,
+        job_id,
+        cancel_event,
+        name,
+        prefer_clipboard,
+        force_window,
+        use_ocr_fallback,
+    ):
+        self.last_activity = time.monotonic()
+        self.idle_warmed = False
+        with self.tracer.trace(name, job=job_id):
+            self.perform_translate(
+                prefer_clipboard,
+                force_window,
+                use_ocr_fallback,
+                job_id=job_id,
+                cancel_event=cancel_event,
+            )
+        self.root.after(0, self._refresh_stats_window)
+
+    def on_hotkey_pressed(self):
         logging.info("Hotkey erkannt: STRG+%s", self.hotkey_key.upper())
-        threading.Thread(
-            target=self.perform_translate,
-            args=(True, False, False),
-            daemon=True,
-        ).start()
+        self.scheduler.submit(self._traced_translate, "hotkey", True, False, False)
 
     def on_window_hotkey_pressed(self):
-        now = time.monotonic()
-        if now - self.last_trigger_ts < 0.7:
-            return
-        self.last_trigger_ts = now
         logging.info("Fenster-Hotkey erkannt: STRG+SHIFT+%s", self.hotkey_key.upper())
-        threading.Thread(
-            target=self.perform_translate,
-            args=(False, True, True),
-            daemon=True,
-        ).start()
+        self.scheduler.submit(self._traced_translate, "window_hotkey", False, True, True)
 
     def create_tray_icon(self):
+        import pystray
+        from PIL import Image, ImageDraw
+
         image = None
         if self.logo_path:
             try:
@@ -698,10 +3774,16 @@ class TranslationApp:
 
         menu = pystray.Menu(
             pystray.MenuItem("Einstellungen", self.show_settings_from_tray),
+            pystray.MenuItem("Bereich beobachten an/aus", self.toggle_watch),
             pystray.MenuItem("Beenden", self.quit_app),
         )
         self.icon = pystray.Icon("Transilvania", image, "Transilvania OCR", menu)
-        self.icon.run()
+        self.icon.run(setup=self._on_tray_ready)
+
+    def _on_tray_ready(self, icon):
+        icon.visible = True
+        self._mark_startup("tray")
+        self.root.after(0, self._update_requirements_label)
 
     def start_tray_icon(self):
         threading.Thread(target=self.create_tray_icon, daemon=True).start()
@@ -712,6 +3794,9 @@ class TranslationApp:
             WM_QUIT = 0x0012
             MOD_CONTROL = 0x0002
             MOD_SHIFT = 0x0004
+            # Keine Wiederholung beim Gedrueckthalten, sonst ersetzt jeder Tastenrepeat
+            # den laufenden Auftrag.
+            MOD_NOREPEAT = 0x4000
             HK_ID_NORMAL = 1
             HK_ID_WINDOW = 2
 
@@ -720,9 +3805,13 @@ class TranslationApp:
             self.hotkey_thread_id = kernel32.GetCurrentThreadId()
 
             vk = ord(self.hotkey_key.upper())
-            ok_normal = bool(user32.RegisterHotKey(None, HK_ID_NORMAL, MOD_CONTROL, vk))
+            ok_normal = bool(
+                user32.RegisterHotKey(None, HK_ID_NORMAL, MOD_CONTROL | MOD_NOREPEAT, vk)
+            )
             ok_window = bool(
-                user32.RegisterHotKey(None, HK_ID_WINDOW, MOD_CONTROL | MOD_SHIFT, vk)
+                user32.RegisterHotKey(
+                    None, HK_ID_WINDOW, MOD_CONTROL | MOD_SHIFT | MOD_NOREPEAT, vk
+                )
             )
 
             if not ok_normal:
@@ -740,6 +3829,7 @@ class TranslationApp:
                 self.hotkey_combo,
                 self.window_hotkey_combo,
             )
+            self._mark_startup("hotkeys")
 
             msg = wintypes.MSG()
             while True:
@@ -780,6 +3870,9 @@ class TranslationApp:
         webbrowser.open(PROJECT_URL)
 
     def open_about_dialog(self):
+        import tkinter as tk
+        from tkinter.scrolledtext import ScrolledText
+
         if self.about_window and self.about_window.winfo_exists():
             self.about_window.lift()
             self.about_window.focus_force()
@@ -824,6 +3917,87 @@ class TranslationApp:
         readme_text.insert("1.0", self._load_readme_text())
         readme_text.config(state="disabled")
 
+    def _stats_report(self):
+        stats = self.tracer.stage_stats()
+        with self.tracer.lock:
+            marks = sorted(self.startup_marks.items(), key=lambda item: item[1])
+        lines = []
+        if marks:
+            lines.append("Start: " + ", ".join(f"{name}={ms:.0f}ms" for name, ms in marks))
+            lines.append("")
+        if not stats:
+            lines.append("Noch keine Messungen. Hotkey druecken, dann aktualisieren.")
+            return "\n".join(lines)
+        lines.append(f"{'Stufe':<20}{'n':>6}{'p50':>9}{'p95':>9}{'p99':>9}  (ms)")
+        for stage, row in sorted(stats.items(), key=lambda item: -item[1]["p50_ms"]):
+            lines.append(
+                f"{stage:<20}{row['count']:>6}{row['p50_ms']:>9.1f}"
+                f"{row['p95_ms']:>9.1f}{row['p99_ms']:>9.1f}"
+            )
+        lines.append("")
+        lines.append(self.translation_cache.stats_text())
+        if self.ocr_profile:
+            lines.append("OCR-Profil: " + describe_ocr_profile(self.ocr_profile))
+        return "\n".join(lines)
+
+    def _refresh_stats_window(self):
+        if not (self.stats_window and self.stats_window.winfo_exists()):
+            return
+        self.stats_text.config(state="normal")
+        self.stats_text.delete("1.0", "end")
+        self.stats_text.insert("1.0", self._stats_report())
+        self.stats_text.config(state="disabled")
+
+    def export_stats(self):
+        from tkinter import messagebox
+
+        target = self.local_tessdata_dir.parent / "latency_stats.json"
+        try:
+            self.tracer.dump(target)
+            logging.info("Latenz-Statistik exportiert: %s", target)
+            messagebox.showinfo(
+                "Latenz-Statistik",
+                f"Gespeichert:\n{target}",
+                parent=self.stats_window,
+            )
+        except Exception:
+            logging.exception("Latenz-Statistik konnte nicht exportiert werden.")
+
+    def open_stats_window(self):
+        import tkinter as tk
+        from tkinter.scrolledtext import ScrolledText
+
+        if self.stats_window and self.stats_window.winfo_exists():
+            self._refresh_stats_window()
+            self.stats_window.lift()
+            self.stats_window.focus_force()
+            return
+
+        win = tk.Toplevel(self.root)
+        win.title("Latenz-Statistik")
+        win.geometry("520x360")
+        win.configure(bg="#101010")
+        win.attributes("-topmost", True)
+        self.stats_window = win
+
+        self.stats_text = ScrolledText(
+            win,
+            wrap="none",
+            bg="#171717",
+            fg="#f0f0f0",
+            font=("Consolas", 10),
+            height=14,
+        )
+        self.stats_text.pack(fill="both", expand=True, padx=12, pady=(12, 8))
+
+        buttons = tk.Frame(win, bg="#101010")
+        buttons.pack(fill="x", padx=12, pady=(0, 12))
+        tk.Button(buttons, text="Aktualisieren", command=self._refresh_stats_window).pack(
+            side="left"
+        )
+        tk.Button(buttons, text="Exportieren (JSON)", command=self.export_stats).pack(side="right")
+        self._refresh_stats_window()
+
     def hide_to_background(self):
         self.root.withdraw()
 
@@ -841,6 +4015,12 @@ class TranslationApp:
                 ctypes.windll.user32.PostThreadMessageW(self.hotkey_thread_id, 0x0012, 0, 0)
             if self.icon:
                 self.icon.stop()
+            self.scheduler.shutdown()
+            self.watchdog_stop.set()
+            self.capture.close()
+            if self.watcher is not None:
+                self.watcher.stop()
+            self.close()
             self.root.quit()
             self.root.destroy()
             sys.exit(0)
@@ -851,6 +4031,661 @@ class TranslationApp:
         self.root.mainloop()
 
 
-if __name__ == "__main__":
+BATCH_IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff", ".webp", ".gif"}
+BATCH_TRANSLATE_WORKERS = 8
+
+_batch_core = None
+
+
+def _batch_worker_init(ocr_languages, tessdata_dir, tesseract_path, osd_available=False):
+    # Laeuft einmal pro Worker-Prozess: Engine laden und fuer alle Dateien behalten.
+    # Parallelitaet kommt ueber die Prozesse, daher die PSM-Konfigurationen sequentiell.
+    global _batch_core
+    import pytesseract
+
+    core = TranslationCore(ocr_languages, tessdata_dir, persistent_cache=False)
+    core.available_ocr_languages = list(ocr_languages)
+    core.osd_available = osd_available
+    core.tesseract_path = tesseract_path
+    core.tesseract_ready = True
+    core.ocr_parallel = False
+    core.ocr_workers = 1
+    pytesseract.pytesseract.tesseract_cmd = tesseract_path
+    core.init_ocr_engine()
+    _batch_core = core
+
+
+def _batch_ocr_file(path):
+    from PIL import Image
+
+    core = _batch_core
+    record = {"path": path}
+    timings = {}
+    try:
+        start = time.perf_counter()
+        with Image.open(path) as img:
+            image = img.convert("RGB")
+        timings["load_ms"] = _elapsed_ms(start)
+        record["width"], record["height"] = image.size
+
+        start = time.perf_counter()
+        processed = core._preprocess_for_ocr(image)
+        timings["preprocess_ms"] = _elapsed_ms(start)
+
+        start = time.perf_counter()
+        result = core._extract_text_multi_config(processed)
+        timings["ocr_ms"] = _elapsed_ms(start)
+
+        record["text"] = result.text
+        record["confidence"] = round(result.confidence, 1)
+        record["config"] = result.config
+    except Exception as exc:
+        logging.exception("Batch-OCR fehlgeschlagen: %s", path)
+        record["error"] = str(exc)
+    record["timings_ms"] = timings
+    return record
+
+
+def _iter_batch_images(inputs, recursive=False):
+    for raw in inputs:
+        path = Path(raw)
+        if path.is_dir():
+            pattern = "**/*" if recursive else "*"
+            for candidate in sorted(path.glob(pattern)):
+                if candidate.is_file() and candidate.suffix.lower() in BATCH_IMAGE_SUFFIXES:
+                    yield candidate
+        elif path.is_file():
+            yield path
+        else:
+            logging.warning("Batch-Eingabe nicht gefunden: %s", path)
+
+
+def run_batch(
+    inputs,
+    output=None,
+    workers=None,
+    target="de",
+    translate=True,
+    recursive=False,
+    ocr_languages=None,
+    tessdata_dir=None,
+    translation_policy="online",
+):
+    # OCR laeuft CPU-gebunden in einem Prozess-Pool, die Uebersetzung netzgebunden in
+    # einem Thread-Pool im Hauptprozess (gemeinsamer Cache). Jede fertige Datei wird
+    # sofort als JSONL-Zeile geschrieben.
+    core = TranslationCore(ocr_languages, tessdata_dir)
+    core.translation_targets = parse_targets(target) or ["de"]
+    core.translation_policy = translation_policy
+    if not core.setup_tesseract():
+        print("Tesseract nicht gefunden.", file=sys.stderr)
+        return 2
+    core.ensure_ocr_languages()
+    if not core.available_ocr_languages:
+        print("Keine OCR-Sprachdateien verfuegbar.", file=sys.stderr)
+        return 2
+
+    paths = [str(p) for p in _iter_batch_images(inputs, recursive)]
+    if not output and sys.stdout is None:
+        # Fenster-Build (console=False) hat kein stdout.
+        output = str(Path.cwd() / "transilvania_batch.jsonl")
+        logging.info("Kein stdout, schreibe Batch-Ergebnis nach %s", output)
+    out = open(output, "w", encoding="utf-8") if output else sys.stdout
+    write_lock = threading.Lock()
+    counts = {"ok": 0, "errors": 0}
+
+    def _emit(record):
+        with write_lock:
+            counts["errors" if record.get("error") else "ok"] += 1
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+
+    def _translate_record(record):
+        start = time.perf_counter()
+        try:
+            record["text_check"] = core._check_text(record["text"])
+            if record["text_check"] != "noise":
+                translations = core.translate_targets(record["text"])
+                record["translation"] = translations[0][1]
+                if len(core.translation_targets) > 1:
+                    record["translations"] = dict(translations)
+        except Exception as exc:
+            logging.exception("Batch-Uebersetzung fehlgeschlagen: %s", record["path"])
+            record["error"] = str(exc)
+        record["timings_ms"]["translate_ms"] = _elapsed_ms(start)
+        return record
+
+    started = time.perf_counter()
+    try:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count() or 1,
+            initializer=_batch_worker_init,
+            initargs=(
+                core.available_ocr_languages,
+                str(core.local_tessdata_dir),
+                core.tesseract_path,
+                core.osd_available,
+            ),
+        ) as ocr_pool, concurrent.futures.ThreadPoolExecutor(
+            max_workers=BATCH_TRANSLATE_WORKERS,
+            thread_name_prefix="translate",
+        ) as translate_pool:
+            futures = [ocr_pool.submit(_batch_ocr_file, path) for path in paths]
+            for future in concurrent.futures.as_completed(futures):
+                record = future.result()
+                if translate and record.get("text") and not record.get("error"):
+                    translate_pool.submit(_translate_record, record).add_done_callback(
+                        lambda done: _emit(done.result())
+                    )
+                else:
+                    _emit(record)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        core.close()
+
+    elapsed = time.perf_counter() - started
+    print(
+        f"{len(paths)} Bilder in {elapsed:.1f} s "
+        f"({len(paths) / elapsed if elapsed else 0.0:.2f}/s), "
+        f"{counts['errors']} Fehler.",
+        file=sys.stderr,
+    )
+    return 1 if counts["errors"] else 0
+
+
+BENCH_SAMPLES = {
+    "eng": (
+        "The quick brown fox jumps over the lazy dog",
+        "Settings saved successfully",
+        "Connection lost. Retry in 5 seconds",
+    ),
+    "rus": (
+        "Съешь же ещё этих мягких французских булок",
+        "Настройки успешно сохранены",
+        "Соединение потеряно. Повтор через 5 секунд",
+    ),
+    "ukr": (
+        "Чуєш їх, доцю, га? Кумедна ж ти, прощайся без ґольфів",
+        "Налаштування успішно збережено",
+        "З'єднання втрачено",
+    ),
+    "ara": (
+        "مرحبا بالعالم",
+        "تم حفظ الإعدادات بنجاح",
+        "انقطع الاتصال",
+    ),
+}
+BENCH_FONT_SIZES = (9, 12, 16, 24)
+BENCH_CONTRASTS = (1.0, 0.35)
+BENCH_DPIS = (96, 144)
+BENCH_NOISE = (0, 12)
+BENCH_FONT_CANDIDATES = (
+    r"C:\Windows\Fonts\arial.ttf",
+    r"C:\Windows\Fonts\segoeui.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/truetype/noto/NotoSans-Regular.ttf",
+)
+BENCH_REGRESSION_LATENCY = 0.10
+BENCH_REGRESSION_CER = 0.01
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def levenshtein(a, b):
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+def character_error_rate(reference, hypothesis):
+    reference = TranslationCache.normalize(reference)
+    hypothesis = TranslationCache.normalize(hypothesis)
+    if not reference:
+        return 0.0 if not hypothesis else 1.0
+    return levenshtein(reference, hypothesis) / len(reference)
+
+
+def _find_bench_font(font_path=None):
+    for candidate in ([font_path] if font_path else []) + list(BENCH_FONT_CANDIDATES):
+        if candidate and Path(candidate).exists():
+            return candidate
+    return None
+
+
+def generate_bench_corpus(languages, font_path, samples_per_text=1, seed=1234):
+    # Erzeugt offline synthetische Textbilder (Schriftgroesse, Kontrast, DPI, Rauschen).
+    # Rueckgabe: Liste von (Sprache, Referenztext, Bild, Variantenbeschreibung).
+    from PIL import ImageFont, features
+
+    rng = random.Random(seed)
+    has_raqm = features.check("raqm")
+    corpus = []
+    for lang in languages:
+        if lang == "ara" and not has_raqm:
+            logging.warning("Benchmark: ohne libraqm kein Arabisch-Shaping, ueberspringe ara.")
+            continue
+        for text in BENCH_SAMPLES.get(lang, ()):
+            for size in BENCH_FONT_SIZES:
+                for dpi in BENCH_DPIS:
+                    font = ImageFont.truetype(font_path, max(6, round(size * dpi / 96)))
+                    for contrast in BENCH_CONTRASTS:
+                        for noise in BENCH_NOISE:
+                            for _ in range(samples_per_text):
+                                image = _render_bench_image(text, font, contrast, noise, rng)
+                                variant = {
+                                    "size": size,
+                                    "dpi": dpi,
+                                    "contrast": contrast,
+                                    "noise": noise,
+                                }
+                                corpus.append((lang, text, image, variant))
+    return corpus
+
+
+def _render_bench_image(text, font, contrast, noise, rng):
+    from PIL import Image, ImageChops, ImageDraw
+
+    left, top, right, bottom = font.getbbox(text)
+    pad_x = rng.randint(6, 24)
+    pad_y = rng.randint(4, 16)
+    background = 235
+    foreground = round(background - 220 * contrast)
+    image = Image.new("L", (right - left + 2 * pad_x, bottom - top + 2 * pad_y), background)
+    ImageDraw.Draw(image).text((pad_x - left, pad_y - top), text, font=font, fill=foreground)
+    if noise:
+        grain = Image.effect_noise(image.size, noise)
+        image = ImageChops.add(image, grain, offset=-128)
+    return image.convert("RGB")
+
+
+def _bench_combinations():
+    combos = []
+    for scale in (None, 1, 2, 3):
+        label = "auto" if scale is None else f"x{scale}"
+        for cfg in OCR_CONFIGS:
+            combos.append((f"{label}|{cfg}", scale, (cfg,)))
+        combos.append((f"{label}|multi", scale, OCR_CONFIGS))
+    return combos
+
+
+def _run_bench_combo(core, corpus, scale, configs, binarize=True):
+    # Misst ueber denselben Pfad wie die App (_extract_text_multi_config), die Einstellungen
+    # des Kerns werden nur fuer die Dauer der Messung ersetzt.
+    latencies = []
+    errors = []
+    per_lang = collections.defaultdict(list)
+    previous = (core.ocr_configs, core.ocr_scale, core.ocr_binarize)
+    core.ocr_configs, core.ocr_scale, core.ocr_binarize = tuple(configs), scale, binarize
+    started = time.perf_counter()
+    try:
+        for sample_lang, reference, image, _variant in corpus:
+            start = time.perf_counter()
+            processed = core._preprocess_for_ocr(image)
+            result = core._extract_text_multi_config(processed)
+            latencies.append((time.perf_counter() - start) * 1000.0)
+            cer = character_error_rate(reference, result.text)
+            errors.append(cer)
+            per_lang[sample_lang].append(cer)
+    finally:
+        core.ocr_configs, core.ocr_scale, core.ocr_binarize = previous
+    elapsed = time.perf_counter() - started
+    return {
+        "images": len(corpus),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "throughput_per_s": round(len(corpus) / elapsed, 3) if elapsed else 0.0,
+        "cer": round(sum(errors) / len(errors), 4) if errors else 0.0,
+        "cer_by_lang": {k: round(sum(v) / len(v), 4) for k, v in sorted(per_lang.items())},
+    }
+
+
+def compare_bench_results(baseline, current):
+    regressions = []
+    for name, now in current.items():
+        before = baseline.get(name)
+        if not before:
+            continue
+        if before["p50_ms"] and now["p50_ms"] > before["p50_ms"] * (1 + BENCH_REGRESSION_LATENCY):
+            regressions.append(f"{name}: p50 {before['p50_ms']} -> {now['p50_ms']} ms")
+        if now["cer"] > before["cer"] + BENCH_REGRESSION_CER:
+            regressions.append(f"{name}: CER {before['cer']} -> {now['cer']}")
+    return regressions
+
+
+def run_benchmark(
+    ocr_languages=None,
+    tessdata_dir=None,
+    font_path=None,
+    samples_per_text=1,
+    save_baseline=None,
+    baseline=None,
+):
+    core = TranslationCore(ocr_languages, tessdata_dir, persistent_cache=False)
+    if not core.setup_tesseract():
+        print("Tesseract nicht gefunden.", file=sys.stderr)
+        return 2
+    core.ensure_ocr_languages()
+    if not core.available_ocr_languages:
+        print("Keine OCR-Sprachdateien verfuegbar.", file=sys.stderr)
+        return 2
+    core.init_ocr_engine()
+
+    font = _find_bench_font(font_path)
+    if not font:
+        print("Keine Schriftart fuer den Benchmark gefunden (--bench-font).", file=sys.stderr)
+        return 2
+
+    corpus = generate_bench_corpus(core.available_ocr_languages, font, samples_per_text)
+    print(f"Korpus: {len(corpus)} Bilder, Schrift {font}", file=sys.stderr)
+
+    results = {}
+    try:
+        for name, scale, configs in _bench_combinations():
+            results[name] = _run_bench_combo(core, corpus, scale, configs)
+            row = results[name]
+            print(
+                f"{name:<24} p50={row['p50_ms']:>8.1f} p95={row['p95_ms']:>8.1f} "
+                f"p99={row['p99_ms']:>8.1f} ms  {row['throughput_per_s']:>7.2f}/s  "
+                f"CER={row['cer']:.4f}"
+            )
+    finally:
+        core.close()
+
+    report = {
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "languages": core.available_ocr_languages,
+        "images": len(corpus),
+        "results": results,
+    }
+    if save_baseline:
+        Path(save_baseline).write_text(
+            json.dumps(report, indent=2, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        print(f"Baseline gespeichert: {save_baseline}", file=sys.stderr)
+
+    if baseline:
+        previous = json.loads(Path(baseline).read_text(encoding="utf-8"))
+        regressions = compare_bench_results(previous.get("results", {}), results)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print("Keine Regressionen gegenueber der Baseline.", file=sys.stderr)
+    return 0
+
+
+def describe_ocr_profile(profile):
+    scale = profile.get("scale")
+    parts = [
+        "Skalierung " + ("auto" if scale is None else f"x{scale}"),
+        "binarisiert" if profile.get("binarize", True) else "Kontrast-LUT",
+        "PSM " + "+".join(cfg.split()[-1] for cfg in profile["configs"]),
+    ]
+    if "accuracy" in profile:
+        parts.append(f"Genauigkeit {profile['accuracy']:.1%}")
+    if "p50_ms" in profile:
+        parts.append(f"p50 {profile['p50_ms']:.0f} ms")
+    return ", ".join(parts)
+
+
+def load_tune_samples(inputs, recursive=False):
+    # Eigene Aufnahmen mit Referenztext daneben: bild.png + bild.txt (UTF-8).
+    from PIL import Image
+
+    samples = []
+    for path in _iter_batch_images(inputs, recursive):
+        reference = path.with_suffix(".txt")
+        if not reference.exists():
+            logging.warning("Kein Referenztext fuer %s, uebersprungen.", path)
+            continue
+        with Image.open(path) as image:
+            samples.append(
+                (
+                    "capture",
+                    reference.read_text(encoding="utf-8-sig").strip(),
+                    image.convert("RGB"),
+                    {"path": str(path)},
+                )
+            )
+    return samples
+
+
+def _autotune_report(message, final=False, stream=None):
+    # Konsole und Log; im Fenster-Build (kein stdout) kommt das Ergebnis als Dialog.
+    logging.info("Auto-Tuning: %s", message)
+    print(message, file=stream or sys.stderr)
+    if final and sys.stdout is None:
+        try:
+            import tkinter as tk
+            from tkinter import messagebox
+
+            root = tk.Tk()
+            root.withdraw()
+            messagebox.showinfo("Transilvania Auto-Tuning", message, parent=root)
+            root.destroy()
+        except Exception:
+            logging.exception("Ergebnis-Dialog konnte nicht angezeigt werden.")
+
+
+def _autotune_candidates(config_sets):
+    for scale in AUTOTUNE_SCALES:
+        for binarize in (True, False):
+            for configs in config_sets:
+                yield scale, binarize, tuple(configs)
+
+
+def run_autotune(
+    inputs,
+    recursive=False,
+    min_accuracy=AUTOTUNE_MIN_ACCURACY,
+    ocr_languages=None,
+    tessdata_dir=None,
+):
+    # Sucht auf eigenen Aufnahmen die schnellste Kombination aus Vorverarbeitung und
+    # Tesseract-Konfiguration, die die Zielgenauigkeit (1 - CER) erreicht. Zuerst nur
+    # einzelne PSMs; mehrere Durchlaeufe werden nur probiert, wenn keiner allein reicht.
+    core = TranslationCore(ocr_languages, tessdata_dir, persistent_cache=False)
+    if not core.setup_tesseract():
+        _autotune_report("Tesseract nicht gefunden.", final=True)
+        return 2
+    core.ensure_ocr_languages()
+    if not core.available_ocr_languages:
+        _autotune_report("Keine OCR-Sprachdateien verfuegbar.", final=True)
+        return 2
+    samples = load_tune_samples(inputs, recursive)
+    if not samples:
+        _autotune_report("Keine Aufnahmen mit Referenztext (bild.png + bild.txt).", final=True)
+        return 2
+    core.init_ocr_engine()
+    _autotune_report(f"{len(samples)} Aufnahmen, Ziel {min_accuracy:.1%}")
+
+    results = []
+
+    def _measure(candidates):
+        for scale, binarize, configs in candidates:
+            row = _run_bench_combo(core, samples, scale, configs, binarize)
+            row["accuracy"] = round(1.0 - row["cer"], 4)
+            profile = {"configs": list(configs), "scale": scale, "binarize": binarize}
+            results.append((profile, row))
+            _autotune_report(
+                f"{describe_ocr_profile(profile):<48} p50={row['p50_ms']:>8.1f} ms  "
+                f"Genauigkeit={row['accuracy']:.4f}",
+                stream=sys.stdout,
+            )
+
+    try:
+        # Erster Lauf laedt nur die Modelle und zaehlt nicht.
+        _run_bench_combo(core, samples[:1], None, OCR_CONFIGS[:1])
+        _measure([(None, True, OCR_CONFIGS)])
+        baseline = results[0][1]
+        _measure(_autotune_candidates([(cfg,) for cfg in AUTOTUNE_CONFIGS]))
+        if not any(row["accuracy"] >= min_accuracy for _profile, row in results[1:]):
+            best_cer = {}
+            for profile, row in results[1:]:
+                cfg = profile["configs"][0]
+                best_cer[cfg] = min(best_cer.get(cfg, 1.0), row["cer"])
+            top = sorted(best_cer, key=best_cer.get)[:3]
+            config_sets = [(a, b) for i, a in enumerate(top) for b in top[i + 1 :]]
+            if len(top) > 2:
+                config_sets.append(tuple(top))
+            _measure(_autotune_candidates(config_sets))
+    finally:
+        core.close()
+
+    passing = [item for item in results if item[1]["accuracy"] >= min_accuracy]
+    if not passing:
+        best = max(row["accuracy"] for _profile, row in results)
+        _autotune_report(
+            f"Kein Profil erreicht {min_accuracy:.1%} (bestes: {best:.1%}), nichts gespeichert.",
+            final=True,
+        )
+        return 1
+
+    profile, row = min(passing, key=lambda item: (item[1]["p50_ms"], item[1]["cer"]))
+    profile.update(
+        {
+            "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "languages": core.available_ocr_languages,
+            "samples": len(samples),
+            "escalate_chars": core.ocr_escalate_chars,
+            "min_accuracy": min_accuracy,
+            "accuracy": row["accuracy"],
+            "p50_ms": row["p50_ms"],
+            "baseline": {"accuracy": baseline["accuracy"], "p50_ms": baseline["p50_ms"]},
+        }
+    )
+    path = core._ocr_profile_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(profile, indent=2, ensure_ascii=False), encoding="utf-8")
+    _autotune_report(
+        f"Profil gespeichert: {path}\n{describe_ocr_profile(profile)} "
+        f"(Standard: p50 {baseline['p50_ms']:.0f} ms, Genauigkeit {baseline['accuracy']:.1%})",
+        final=True,
+    )
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="Transilvania",
+        description="Tray-App fuer OCR-Uebersetzung. Ohne Argumente startet die GUI.",
+        fromfile_prefix_chars="@",
+    )
+    parser.add_argument(
+        "--batch",
+        nargs="+",
+        metavar="PFAD",
+        help="Bilder oder Ordner ohne GUI verarbeiten (@liste.txt liest Pfade aus Datei).",
+    )
+    parser.add_argument("--output", help="JSONL-Ausgabedatei (Standard: stdout).")
+    parser.add_argument("--workers", type=int, help="Anzahl OCR-Prozesse (Standard: alle Kerne).")
+    parser.add_argument(
+        "--target",
+        default="de",
+        help="Zielsprache(n), z.B. de+en+fr (Standard: de).",
+    )
+    parser.add_argument("--recursive", action="store_true", help="Ordner rekursiv durchsuchen.")
+    parser.add_argument(
+        "--translator",
+        choices=sorted(TRANSLATION_POLICIES),
+        default="online",
+        help="Uebersetzungs-Richtlinie, z.B. offline_first (Standard: online).",
+    )
+    parser.add_argument(
+        "--no-translate",
+        action="store_true",
+        help="Nur OCR, keine Uebersetzung.",
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="OCR-Benchmark mit synthetischem Korpus (Latenz, Durchsatz, CER).",
+    )
+    parser.add_argument("--bench-font", help="TrueType-Schrift fuer den Benchmark-Korpus.")
+    parser.add_argument(
+        "--bench-samples",
+        type=int,
+        default=1,
+        help="Bilder pro Text und Variante.",
+    )
+    parser.add_argument("--save-baseline", metavar="JSON", help="Benchmark-Ergebnis speichern.")
+    parser.add_argument(
+        "--baseline",
+        metavar="JSON",
+        help="Mit gespeicherter Baseline vergleichen.",
+    )
+    parser.add_argument(
+        "--autotune",
+        nargs="+",
+        metavar="PFAD",
+        help="OCR-Profil auf eigenen Aufnahmen abstimmen (bild.png + bild.txt als Referenz).",
+    )
+    parser.add_argument(
+        "--min-accuracy",
+        type=float,
+        default=AUTOTUNE_MIN_ACCURACY,
+        help="Zielgenauigkeit fuer --autotune, 1 - CER (Standard: 0.95).",
+    )
+    parser.add_argument("--languages", help="OCR-Sprachen, z.B. eng+rus (Standard: alle).")
+    parser.add_argument("--tessdata-dir", help="Ordner fuer .traineddata-Dateien.")
+    args = parser.parse_args(argv)
+
+    ocr_languages = args.languages.split("+") if args.languages else None
+    if args.benchmark:
+        return run_benchmark(
+            ocr_languages=ocr_languages,
+            tessdata_dir=args.tessdata_dir,
+            font_path=args.bench_font,
+            samples_per_text=args.bench_samples,
+            save_baseline=args.save_baseline,
+            baseline=args.baseline,
+        )
+
+    if args.autotune:
+        return run_autotune(
+            args.autotune,
+            recursive=args.recursive,
+            min_accuracy=args.min_accuracy,
+            ocr_languages=ocr_languages,
+            tessdata_dir=args.tessdata_dir,
+        )
+
+    if args.batch:
+        return run_batch(
+            args.batch,
+            output=args.output,
+            workers=args.workers,
+            target=args.target,
+            translate=not args.no_translate,
+            recursive=args.recursive,
+            ocr_languages=ocr_languages,
+            tessdata_dir=args.tessdata_dir,
+            translation_policy=args.translator,
+        )
+
     app = TranslationApp()
     app.run()
+    return 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())